@@ -1,16 +1,160 @@
 import os
+import threading
 import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional
 
+from app_v2.utils.logger import get_logger
+from app_v2.utils.periodic import remaining_interval
 
-def run_worker_loop():
+logger = get_logger(__name__)
+
+# State-change Ledger rows are inserted together once this many accumulate or this much time has passed
+HEARTBEAT_BATCH_SIZE = int(os.getenv("HEARTBEAT_BATCH_SIZE", "6"))
+HEARTBEAT_FLUSH_SECONDS = int(os.getenv("HEARTBEAT_FLUSH_SECONDS", "3600"))
+
+# Set on app shutdown so the loops exit instead of sleeping out the interval
+_STOP = threading.Event()
+
+
+def stop_worker_loop() -> None:
+    """Signal run_worker_loop to return at its next wait."""
+    _STOP.set()
+
+
+def _heartbeat_loop(interval_seconds: int) -> None:
+    """Placeholder heartbeat without DB access."""
+    while not _STOP.wait(interval_seconds):
+        pass
+
+
+def _state_hash() -> int:
+    """Fingerprint of the engine counters; a new Ledger row is written only when it changes."""
+    from app_v2.models.system_state import system_state
+
+    status = system_state.get_status()
+    engines = status["engines"].values()
+    return hash((
+        sum(e["total_errors"] for e in engines),
+        sum(e["total_runs"] for e in engines),
+        status["metrics"]["inbound_velocity_last_hour"],
+    ))
+
+
+def _write_tick(db, ledger_rows: List[Dict[str, Any]], last_seen_at: datetime, state_hash: int, ticks: int = 1) -> None:
+    """
+    Bump the single worker_status row (one UPDATE) plus any Ledger rows being flushed, in one commit.
+    """
+    from sqlalchemy import insert, update
+    from app_v2.models.ledger import Ledger
+    from app_v2.models.worker_status import WORKER_STATUS_ID, WorkerStatus
+
+    try:
+        if ledger_rows:
+            # Core executemany: one INSERT statement for the batch, no unit-of-work bookkeeping
+            db.execute(insert(Ledger.__table__), ledger_rows)
+        touched = db.execute(
+            update(WorkerStatus)
+            .where(WorkerStatus.id == WORKER_STATUS_ID)
+            .values(last_seen_at=last_seen_at, ticks=WorkerStatus.ticks + ticks, state_hash=state_hash)
+        )
+        if touched.rowcount == 0:
+            db.add(WorkerStatus(id=WORKER_STATUS_ID, last_seen_at=last_seen_at, ticks=ticks, state_hash=state_hash))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _db_loop(
+    interval_seconds: float,
+    session_factory: Callable[[], Any],
+    clock: Callable[[], float] = time.monotonic,
+    now: Callable[[], datetime] = _utc_now,
+) -> None:
+    """
+    Lightweight DB heartbeat: every tick stamps worker_status.last_seen_at with one
+    UPDATE; a full Ledger row is recorded only when engine state changed since the
+    last tick, and those rows are inserted in batches alongside a tick.
+    """
+    from sqlalchemy.orm import scoped_session
+
+    # Thread-local session kept for the life of the loop; it only holds a transaction while writing
+    SessionLocal = scoped_session(session_factory)
+    db = SessionLocal()
+    buf: Deque = deque()
+    last_hash = None
+    last_flush = clock()
+
+    def write(last_seen_at: datetime, ticks: int, flush_ledger: bool) -> None:
+        nonlocal db, last_flush
+        rows = list(buf) if flush_ledger and buf else []
+        try:
+            _write_tick(db, rows, last_seen_at, last_hash, ticks)
+        except Exception:
+            logger.exception("Worker heartbeat write failed")
+            if rows:
+                logger.warning(f"Dropping {len(rows)} buffered worker Ledger rows")
+            # Likely a dropped connection; start over with a fresh session
+            SessionLocal.remove()
+            db = SessionLocal()
+        if rows:
+            # Flushed or failed, the batch is dropped either way
+            buf.clear()
+            last_flush = clock()
+
+    last_seen_at = now()
+    try:
+        while True:
+            tick_start = clock()
+            # Stamp the tick itself; the column's server default would give every row in a batch the flush time
+            last_seen_at = now()
+            state_hash = _state_hash()
+            if state_hash != last_hash:
+                buf.append({"engine": "v2", "action": "worker_tick_state_change", "created_at": last_seen_at})
+                last_hash = state_hash
+            flush_ledger = len(buf) >= HEARTBEAT_BATCH_SIZE or clock() - last_flush >= HEARTBEAT_FLUSH_SECONDS
+            write(last_seen_at, 1, flush_ledger)
+            if _STOP.wait(remaining_interval(tick_start, interval_seconds, clock)):
+                return
+    finally:
+        if buf:
+            write(last_seen_at, 0, True)
+        SessionLocal.remove()
+
+
+def run_worker_loop(
+    session_factory: Optional[Callable[[], Any]] = None,
+    interval_seconds: Optional[float] = None,
+    clock: Callable[[], float] = time.monotonic,
+    now: Callable[[], datetime] = _utc_now,
+):
     """
     Autonomous execution kernel.
-    DB interactions are disabled to keep startup DB-free.
+    WORKER_MODE=db (or passing session_factory) keeps a worker_status heartbeat
+    (plus Ledger rows on state changes); otherwise the DB-free placeholder runs so
+    startup stays DB-free. interval_seconds defaults to RUN_INTERVAL_MINUTES; clock
+    and now can be swapped out to drive the loop from a test or benchmark.
     """
 
-    interval_minutes = int(os.getenv("RUN_INTERVAL_MINUTES", "10"))
-    interval_seconds = interval_minutes * 60
+    # A stop from a previous run (or test) mustn't make this one return immediately
+    _STOP.clear()
+
+    if interval_seconds is None:
+        interval_seconds = int(os.getenv("RUN_INTERVAL_MINUTES", "10")) * 60
+
+    if session_factory is None and os.getenv("WORKER_MODE") == "db":
+        # Lazy import so the default heartbeat mode never touches the DB
+        from app_v2.database import get_session_maker
+
+        session_factory = get_session_maker()
 
-    while True:
-        # Placeholder heartbeat without DB access
-        time.sleep(interval_seconds)
+    if session_factory is not None:
+        _db_loop(interval_seconds, session_factory, clock=clock, now=now)
+    else:
+        _heartbeat_loop(interval_seconds)
@@ -1,6 +1,8 @@
-import json
 import os
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
 
 # Environment variables
 AIRTABLE_API_KEY = os.environ.get("AIRTABLE_API_KEY") or os.environ.get("AIRTABLE_PAT")
@@ -31,26 +33,28 @@ GOVCON_RDL_TO = os.environ.get("GOVCON_RDL_TO")
 REI_SOURCES_JSON = os.environ.get("REI_SOURCES_JSON")
 
 
-def get_naics_codes() -> List[str]:
-    """Parse GOVCON_NAICS env into a list (comma-separated)."""
+@lru_cache(maxsize=1)
+def get_naics_codes() -> Tuple[str, ...]:
+    """Parse GOVCON_NAICS env into a tuple (comma-separated); parsed once."""
     if not GOVCON_NAICS:
-        return []
+        return ()
     if "," in GOVCON_NAICS:
-        return [code.strip() for code in GOVCON_NAICS.split(",") if code.strip()]
-    return [GOVCON_NAICS.strip()]
+        return tuple(code.strip() for code in GOVCON_NAICS.split(",") if code.strip())
+    return (GOVCON_NAICS.strip(),)
 
 
-def get_rei_sources() -> List[Dict[str, Any]]:
-    """Parse REI_SOURCES_JSON into a list of sources."""
+@lru_cache(maxsize=1)
+def get_rei_sources() -> Tuple[Dict[str, Any], ...]:
+    """Parse REI_SOURCES_JSON into a tuple of sources; parsed once."""
     if not REI_SOURCES_JSON:
-        return []
+        return ()
     try:
-        parsed = json.loads(REI_SOURCES_JSON)
+        parsed = orjson.loads(REI_SOURCES_JSON)
         if isinstance(parsed, list):
-            return [item for item in parsed if isinstance(item, dict)]
-    except json.JSONDecodeError:
-        return []
-    return []
+            return tuple(item for item in parsed if isinstance(item, dict))
+    except orjson.JSONDecodeError:
+        return ()
+    return ()
 
 # Airtable tables
 TABLE_INBOUND_REI = "Inbound_REI_Raw"
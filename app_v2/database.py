@@ -6,28 +6,48 @@ from utils.db_probe import resolve_db_url
 
 Base = declarative_base()
 
+# Shared by every engine loop, the worker and the API; sized so they don't churn connections
+POOL_SIZE = 10
+MAX_OVERFLOW = 20
+POOL_TIMEOUT_SECONDS = 30
+POOL_RECYCLE_SECONDS = 1800
 
-def _build_engine(db_url: str | None = None):
-    url = resolve_db_url(db_url)
+
+def _build_engine(url: str):
     engine_kwargs: dict = {"pool_pre_ping": True}
 
-    if url.startswith("postgresql://"):
+    if url.startswith("postgresql"):
         engine_kwargs["connect_args"] = {"connect_timeout": 3}
+        engine_kwargs.update(
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_timeout=POOL_TIMEOUT_SECONDS,
+            pool_recycle=POOL_RECYCLE_SECONDS,
+        )
     if url.startswith("sqlite"):
         engine_kwargs["connect_args"] = {"check_same_thread": False}
 
     return create_engine(url, **engine_kwargs)
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=None)
+def _engine_for(url: str):
+    return _build_engine(url)
+
+
+@lru_cache(maxsize=None)
+def _session_maker_for(url: str):
+    return sessionmaker(autocommit=False, autoflush=False, bind=_engine_for(url))
+
+
 def get_engine(db_url: str | None = None):
-    """Lazily create and cache the SQLAlchemy engine."""
-    return _build_engine(db_url)
+    """Lazily create and cache the SQLAlchemy engine (one per resolved URL)."""
+    return _engine_for(resolve_db_url(db_url))
 
 
 def get_session_maker(db_url: str | None = None):
-    """Provide a sessionmaker bound to the lazily created engine."""
-    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine(db_url))
+    """Provide the cached sessionmaker bound to the lazily created engine."""
+    return _session_maker_for(resolve_db_url(db_url))
 
 
 def get_db(db_url: str | None = None):
@@ -38,3 +58,12 @@ def get_db(db_url: str | None = None):
         yield db
     finally:
         db.close()
+
+
+def __getattr__(name: str):
+    # `engine` / `SessionLocal` resolve on first access so importing this module stays DB-free
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_maker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
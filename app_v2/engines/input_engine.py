@@ -1,16 +1,71 @@
 import time
-import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+
+import orjson
+
 from app_v2 import config
 from app_v2.models.deal import Deal
 from app_v2.models.system_state import system_state
 from app_v2.utils import airtable_client
 from app_v2.utils.discord_client import post_ops, post_error
+from app_v2.utils.periodic import collect_after_cycle, idle_backoff_interval, sleep_for_interval
 from app_v2.utils.logger import get_logger, log_engine_cycle, log_error
 
 logger = get_logger(__name__)
 
+# Per-cycle cap on staging rows, and the only columns ingest_from_staging reads
+STAGING_BATCH_SIZE = 200
+STAGING_READ_FIELDS = [
+    "External_Id", "Source", "Address", "City", "State", "ZIP", "ARV", "Asking", "Repairs", "Name",
+]
+
+# Accepted (lowercased) spellings per field, first non-empty wins
+_ADDRESS_ALIASES = (
+    ("address",),
+    ("city",),
+    ("state",),
+    ("zip", "zip_code"),
+)
+_MONEY_ALIASES = (
+    ("arv",),
+    ("asking", "ask"),
+    ("repairs",),
+)
+_SOURCE_ALIASES = ("source",)
+_EXTERNAL_ID_ALIASES = ("external_id",)
+_SELLER_NAME_ALIASES = ("name", "seller_name")
+
+
+def _lc(raw_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Lowercase string keys once at ingress; on a case collision the first non-empty value wins."""
+    out: Dict[str, Any] = {}
+    for key, value in raw_data.items():
+        if isinstance(key, str):
+            key = key.lower()
+        if not out.get(key):
+            out[key] = value
+    return out
+
+
+def _first_value(raw_data: Dict[str, Any], aliases: Tuple[str, ...], default: Any = None) -> Any:
+    """First truthy value among the alias keys, else default."""
+    get = raw_data.get
+    for alias in aliases:
+        value = get(alias)
+        if value:
+            return value
+    return default
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
 
 class InputEngine:
     """
@@ -28,6 +83,11 @@ class InputEngine:
         self.logger = get_logger(self.__class__.__name__)
         self.leads_ingested_last_hour = 0
         self.last_velocity_reset = datetime.utcnow()
+        # Consecutive cycles that processed nothing; drives the idle backoff
+        self._empty_streak = 0
+        self._cycle_count = 0
+        # record_id -> merged staging patch; kept across cycles until written, so retries coalesce
+        self._pending_patches: Dict[str, Dict[str, Any]] = {}
 
     def parse_raw_payload(self, raw_payload: str) -> Optional[Dict[str, Any]]:
         """
@@ -39,7 +99,7 @@ class InputEngine:
                 return None
 
             # Try parsing as JSON
-            data = json.loads(raw_payload)
+            data = orjson.loads(raw_payload)
 
             # Basic validation
             if not isinstance(data, dict):
@@ -47,7 +107,7 @@ class InputEngine:
 
             return data
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.warning(f"Failed to parse raw payload: {e}")
             return None
         except Exception as e:
@@ -60,50 +120,19 @@ class InputEngine:
         Handles various input formats and field name variations.
         """
         try:
+            # Match field names case-insensitively
+            fields = _lc(raw_data)
+
             # Extract address fields (handle variations)
-            address = raw_data.get("address") or raw_data.get("Address") or ""
-            city = raw_data.get("city") or raw_data.get("City") or ""
-            state = raw_data.get("state") or raw_data.get("State") or ""
-            zip_code = raw_data.get("zip") or raw_data.get("ZIP") or raw_data.get("zip_code") or ""
+            address, city, state, zip_code = (_first_value(fields, aliases, "") for aliases in _ADDRESS_ALIASES)
 
             # Extract financial fields (handle variations)
-            arv = None
-            asking = None
-            repairs = None
-
-            # ARV
-            arv_raw = raw_data.get("arv") or raw_data.get("ARV")
-            if arv_raw is not None:
-                try:
-                    arv = float(arv_raw)
-                except (ValueError, TypeError):
-                    pass
-
-            # Asking price
-            asking_raw = (
-                raw_data.get("asking") or
-                raw_data.get("Asking") or
-                raw_data.get("ask") or
-                raw_data.get("Ask")
-            )
-            if asking_raw is not None:
-                try:
-                    asking = float(asking_raw)
-                except (ValueError, TypeError):
-                    pass
-
-            # Repairs
-            repairs_raw = raw_data.get("repairs") or raw_data.get("Repairs")
-            if repairs_raw is not None:
-                try:
-                    repairs = float(repairs_raw)
-                except (ValueError, TypeError):
-                    pass
+            arv, asking, repairs = (_to_float(_first_value(fields, aliases)) for aliases in _MONEY_ALIASES)
 
             # Extract metadata
-            source = raw_data.get("source") or raw_data.get("Source") or "UNKNOWN"
-            external_id = raw_data.get("external_id") or raw_data.get("External_Id") or f"INPUT_{int(time.time())}"
-            seller_name = raw_data.get("name") or raw_data.get("Name") or raw_data.get("seller_name")
+            source = _first_value(fields, _SOURCE_ALIASES, "UNKNOWN")
+            external_id = _first_value(fields, _EXTERNAL_ID_ALIASES) or f"INPUT_{int(time.time())}"
+            seller_name = _first_value(fields, _SELLER_NAME_ALIASES)
 
             # Validation: Must have at least address and one financial field
             if not address and not city:
@@ -126,7 +155,7 @@ class InputEngine:
                 asking=asking,
                 repairs=repairs if repairs is not None else 0.0,
                 seller_name=seller_name,
-                raw_payload=json.dumps(raw_data),
+                raw_payload=orjson.dumps(raw_data).decode("utf-8"),
                 status="NEW",
                 created_at=datetime.utcnow(),
             )
@@ -174,15 +203,17 @@ class InputEngine:
         """
         Pull NEW records from Inbound_REI_Raw that were created externally
         (e.g., via data feed engine or manual entry).
+        Patches are merged per record and written in bulk after the loop.
         Returns count of leads processed.
         """
-        processed = 0
 
         try:
             # Read records with Status=NEW and no Raw_Payload (external source)
             records = airtable_client.read_records(
                 config.TABLE_INBOUND_REI,
-                filter_formula="AND({Status}='NEW', {Raw_Payload}='')"
+                filter_formula="AND({Status}='NEW', {Raw_Payload}='')",
+                max_records=STAGING_BATCH_SIZE,
+                fields=STAGING_READ_FIELDS,
             )
 
             for record in records:
@@ -208,41 +239,26 @@ class InputEngine:
                     deal = self.normalize_lead(raw_data)
                     if not deal:
                         # Mark as ERROR
-                        airtable_client.update_record(
-                            config.TABLE_INBOUND_REI,
-                            record_id,
-                            {
-                                "Status": "ERROR",
-                                "Error_Message": "Failed to normalize lead"
-                            }
-                        )
+                        self._queue_patch(record_id, {
+                            "Status": "ERROR",
+                            "Error_Message": "Failed to normalize lead"
+                        })
                         continue
 
                     # Pre-score
                     if not self.pre_score_lead(deal):
                         # Mark as REJECTED
-                        airtable_client.update_record(
-                            config.TABLE_INBOUND_REI,
-                            record_id,
-                            {
-                                "Status": "REJECTED",
-                                "Error_Message": "Failed pre-screening"
-                            }
-                        )
+                        self._queue_patch(record_id, {
+                            "Status": "REJECTED",
+                            "Error_Message": "Failed pre-screening"
+                        })
                         continue
 
                     # Update record with normalized data + Raw_Payload
-                    airtable_client.update_record(
-                        config.TABLE_INBOUND_REI,
-                        record_id,
-                        {
-                            "Raw_Payload": deal.raw_payload,
-                            "Status": "NEW"  # Keep as NEW for underwriting
-                        }
-                    )
-
-                    processed += 1
-                    self.leads_ingested_last_hour += 1
+                    self._queue_patch(record_id, {
+                        "Raw_Payload": deal.raw_payload,
+                        "Status": "NEW"  # Keep as NEW for underwriting
+                    })
 
                 except Exception as e:
                     log_error(self.logger, f"Failed to process staging record {record.get('id')}", e)
@@ -250,7 +266,36 @@ class InputEngine:
         except Exception as e:
             log_error(self.logger, "Failed to ingest from staging", e)
 
-        return processed
+        return self._flush_patches()
+
+    def _queue_patch(self, record_id: str, patch: Dict[str, Any]) -> None:
+        """Merge a staging patch into the pending set; later keys win."""
+        pending = self._pending_patches.get(record_id)
+        self._pending_patches[record_id] = {**pending, **patch} if pending else patch
+
+    def _flush_patches(self) -> int:
+        """
+        Write all pending staging patches in one bulk update.
+        On failure they stay pending for the next cycle.
+        Returns how many leads were kept NEW with a Raw_Payload (ingested).
+        """
+        if not self._pending_patches:
+            return 0
+
+        patches = self._pending_patches
+        try:
+            airtable_client.update_records_bulk(
+                config.TABLE_INBOUND_REI,
+                [{"id": record_id, "fields": fields} for record_id, fields in patches.items()]
+            )
+        except Exception as e:
+            log_error(self.logger, f"Failed to write {len(patches)} staging updates", e)
+            return 0
+
+        self._pending_patches = {}
+        ingested = sum(1 for fields in patches.values() if fields.get("Status") == "NEW")
+        self.leads_ingested_last_hour += ingested
+        return ingested
 
     def ingest_from_gmail(self) -> int:
         """
@@ -319,6 +364,7 @@ class InputEngine:
         post_ops("🟢 Input Engine started")
 
         while True:
+            cycle_start = time.monotonic()
             try:
                 # Get dynamic interval
                 interval = system_state.get_engine_interval("input")
@@ -332,8 +378,16 @@ class InputEngine:
                     success=result["errors"] == 0
                 )
 
-                # Sleep until next cycle
-                time.sleep(interval)
+                # Back off toward the max interval while there's nothing to ingest
+                self._empty_streak = self._empty_streak + 1 if result["processed"] == 0 else 0
+
+                self._cycle_count += 1
+                collect_after_cycle(self._cycle_count, result["processed"], self._empty_streak)
+
+                interval = idle_backoff_interval(interval, config.INTERVAL_BOUNDS["input"][1], self._empty_streak)
+
+                # Sleep out whatever is left of the interval
+                sleep_for_interval(cycle_start, interval)
 
             except Exception as e:
                 log_error(self.logger, "Input loop critical error", e)
@@ -1,61 +1,132 @@
 import time
-from typing import List
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
 from app_v2 import config
 from app_v2.models.deal import Deal
 from app_v2.models.system_state import system_state
 from app_v2.utils import airtable_client
 from app_v2.utils import scoring_utils
 from app_v2.utils.discord_client import post_deal_alert
+from app_v2.utils.periodic import collect_after_cycle, idle_backoff_interval, sleep_for_interval
 from app_v2.utils.logger import get_logger, log_engine_cycle, log_error
 
 logger = get_logger(__name__)
 
+# Per-cycle cap on staging rows, and the only columns the cycle reads (Raw_Payload is carried to Leads_REI)
+UNDERWRITING_BATCH_SIZE = 200
+UNDERWRITING_READ_FIELDS = [
+    "External_Id", "Source", "Address", "City", "State", "ZIP", "ARV", "Asking", "Repairs", "Name", "Raw_Payload",
+]
 
-def process_deal(deal: Deal) -> bool:
+
+def underwrite_deals(pending: List[Tuple[str, Deal]]) -> Tuple[List[Tuple[str, Deal, Dict[str, Any]]], int]:
     """
-    Underwrite a single deal: compute MAO, spread, strategy
-    Returns True if successful
+    Underwrite a batch of (record_id, deal): compute MAO, spread, strategy for all of
+    them in one vectorized pass, then build the Leads_REI fields per deal.
+    Returns ([(record_id, deal, leads_fields), ...], errors)
     """
-    try:
+    errors = 0
+    valid: List[Tuple[str, Deal]] = []
+    arvs: List[float] = []
+    askings: List[float] = []
+    repairs: List[float] = []
+
+    for record_id, deal in pending:
         # Validate required fields
         if not deal.arv or not deal.asking or deal.repairs is None:
             logger.warning(f"Deal {deal.external_id} missing required fields")
-            return False
+            errors += 1
+            continue
+        try:
+            arv, asking, repair = float(deal.arv), float(deal.asking), float(deal.repairs)
+        except (TypeError, ValueError) as e:
+            log_error(logger, f"Failed to underwrite deal {deal.external_id}", e)
+            errors += 1
+            continue
+        valid.append((record_id, deal))
+        arvs.append(arv)
+        askings.append(asking)
+        repairs.append(repair)
+
+    if not valid:
+        return [], errors
+
+    # Compute metrics and score equity for the whole batch at once
+    n = len(valid)
+    mao, spread, spread_ratio, equity_score, strategy_idx, risk_flags = scoring_utils.batch_score(
+        np.fromiter(arvs, dtype=np.float64, count=n),
+        np.fromiter(askings, dtype=np.float64, count=n),
+        np.fromiter(repairs, dtype=np.float64, count=n),
+    )
+
+    underwritten: List[Tuple[str, Deal, Dict[str, Any]]] = []
+    for (record_id, deal), d_mao, d_spread, d_ratio, d_equity, d_strategy, d_flags in zip(
+        valid, mao.tolist(), spread.tolist(), spread_ratio.tolist(),
+        equity_score.tolist(), strategy_idx.tolist(), risk_flags
+    ):
+        try:
+            deal.mao = d_mao
+            deal.spread = d_spread
+            deal.spread_ratio = d_ratio
+            deal.equity_score = d_equity
+            deal.strategy = scoring_utils.STRATEGIES[d_strategy]
+            deal.risk_flags = d_flags
+
+            # Update status
+            deal.status = "UNDERWRITTEN"
+
+            # Fields for Leads_REI
+            fields = deal.to_airtable_fields()
+            fields["Spread"] = deal.spread
+            fields["Status"] = "UNDERWRITTEN"
+
+            logger.info(
+                f"Underwritten deal {deal.external_id}: "
+                f"spread=${deal.spread:,.0f}, strategy={deal.strategy}"
+            )
 
-        # Compute metrics
-        deal.mao = scoring_utils.compute_mao(deal.arv, deal.repairs)
-        deal.spread = scoring_utils.compute_spread(deal.arv, deal.asking, deal.repairs)
-        deal.spread_ratio = scoring_utils.compute_spread_ratio(deal.arv, deal.spread)
+            underwritten.append((record_id, deal, fields))
 
-        # Score equity
-        deal.equity_score, deal.strategy, deal.risk_flags = scoring_utils.score_equity(
-            deal.arv, deal.asking, deal.repairs
-        )
+        except Exception as e:
+            errors += 1
+            log_error(logger, f"Failed to underwrite deal {deal.external_id}", e)
 
-        # Update status
-        deal.status = "UNDERWRITTEN"
+    return underwritten, errors
 
-        # Write to Leads_REI
-        fields = deal.to_airtable_fields()
-        fields["Spread"] = deal.spread
-        fields["Status"] = "UNDERWRITTEN"
 
-        airtable_client.write_record(config.TABLE_LEADS_REI, fields)
+def _write_underwritten(underwritten: List[Tuple[str, Deal, Dict[str, Any]]]) -> Tuple[int, int]:
+    """
+    Write underwritten deals to Leads_REI and mark their staging rows, 10 at a time.
+    A staging row is only marked once its Leads_REI record exists; alerts follow the write.
+    Returns (processed, errors).
+    """
+    processed = 0
+    errors = 0
 
-        # Alert if high-value deal
-        if deal.spread and deal.spread >= config.HIGH_POTENTIAL_SPREAD:
-            post_deal_alert(deal.address, deal.spread, deal.arv, deal.asking)
+    for i in range(0, len(underwritten), 10):
+        chunk = underwritten[i:i + 10]
+        try:
+            airtable_client.batch_create(config.TABLE_LEADS_REI, [fields for _, _, fields in chunk])
+            # Mark staging as UNDERWRITTEN
+            airtable_client.update_records_bulk(
+                config.TABLE_INBOUND_REI,
+                [{"id": record_id, "fields": {"Status": "UNDERWRITTEN"}} for record_id, _, _ in chunk]
+            )
+        except Exception as e:
+            errors += len(chunk)
+            log_error(logger, f"Failed to write {len(chunk)} underwritten deals", e)
+            continue
 
-        logger.info(
-            f"Underwritten deal {deal.external_id}: "
-            f"spread=${deal.spread:,.0f}, strategy={deal.strategy}"
-        )
+        processed += len(chunk)
 
-        return True
+        # Alert if high-value deal
+        for _, deal, _ in chunk:
+            if deal.spread and deal.spread >= config.HIGH_POTENTIAL_SPREAD:
+                post_deal_alert(deal.address, deal.spread, deal.arv, deal.asking)
 
-    except Exception as e:
-        log_error(logger, f"Failed to underwrite deal {deal.external_id}", e)
-        return False
+    return processed, errors
 
 
 def run_underwriting_cycle() -> dict:
@@ -63,17 +134,20 @@ def run_underwriting_cycle() -> dict:
     Single underwriting cycle:
     1. Pull NEW deals from Inbound_REI_Raw
     2. Compute MAO, spread, strategy
-    3. Write to Leads_REI
+    3. Write to Leads_REI (batched)
     """
     processed = 0
     errors = 0
     start_time = time.time()
+    pending: List[Tuple[str, Deal]] = []
 
     try:
         # Get NEW deals that haven't been underwritten
         records = airtable_client.read_records(
             config.TABLE_INBOUND_REI,
-            filter_formula="{Status}='NEW'"
+            filter_formula="{Status}='NEW'",
+            max_records=UNDERWRITING_BATCH_SIZE,
+            fields=UNDERWRITING_READ_FIELDS,
         )
 
         for record in records:
@@ -94,22 +168,20 @@ def run_underwriting_cycle() -> dict:
                     raw_payload=fields.get("Raw_Payload"),
                 )
 
-                # Underwrite
-                if process_deal(deal):
-                    # Mark staging as UNDERWRITTEN
-                    airtable_client.update_record(
-                        config.TABLE_INBOUND_REI,
-                        record["id"],
-                        {"Status": "UNDERWRITTEN"}
-                    )
-                    processed += 1
-                else:
-                    errors += 1
+                pending.append((record["id"], deal))
 
             except Exception as e:
                 errors += 1
                 log_error(logger, f"Error processing record {record.get('id')}", e)
 
+        # Underwrite
+        underwritten, underwrite_errors = underwrite_deals(pending)
+        errors += underwrite_errors
+
+        written, write_errors = _write_underwritten(underwritten)
+        processed += written
+        errors += write_errors
+
     except Exception as e:
         errors += 1
         log_error(logger, "Underwriting cycle failed", e)
@@ -123,8 +195,12 @@ def run_underwriting_cycle() -> dict:
 def underwriting_loop():
     """Main underwriting engine loop"""
     logger.info("Underwriting engine started")
+    # Consecutive cycles that processed nothing; drives the idle backoff
+    empty_streak = 0
+    cycle_count = 0
 
     while True:
+        cycle_start = time.monotonic()
         try:
             interval = system_state.get_engine_interval("underwriting")
             result = run_underwriting_cycle()
@@ -134,7 +210,15 @@ def underwriting_loop():
                 success=result["errors"] == 0
             )
 
-            time.sleep(interval)
+            # Back off toward the max interval while there's nothing to underwrite
+            empty_streak = empty_streak + 1 if result["processed"] == 0 else 0
+
+            cycle_count += 1
+            collect_after_cycle(cycle_count, result["processed"], empty_streak)
+
+            interval = idle_backoff_interval(interval, config.INTERVAL_BOUNDS["underwriting"][1], empty_streak)
+
+            sleep_for_interval(cycle_start, interval)
 
         except Exception as e:
             log_error(logger, "Underwriting loop error", e)
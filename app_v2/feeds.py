@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
-import math
+import re
+import threading
+import time
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+from urllib.parse import urlsplit, urlunsplit
 
 import requests
-from sqlalchemy import text
+from requests.adapters import HTTPAdapter
+from sqlalchemy import insert, text
 from sqlalchemy.orm import Session
+from urllib3.util.retry import Retry
 
 from app_v2 import config
 from app_v2.models.ops import OpsKV, OpsLedger, advisory_lock_key
@@ -16,7 +26,22 @@ from app_v2.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 SAM_ENDPOINT = "https://api.sam.gov/opportunities/v2/search"
+# Largest page the opportunities API hands out
+SAM_PAGE_LIMIT = 1000
+
+# Keep-alive pool for SAM paging; throttling and gateway errors are retried with backoff
+_SAM_SESSION = requests.Session()
+_SAM_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504], raise_on_status=False),
+    ),
+)
 
 # Airtable constants
 GOVCON_TABLE_ID = "tblD9uurYJe33RvrM"
@@ -27,6 +52,36 @@ LEADS_REI_TABLE_ID = "tbl1k98DeudVoMkoL"
 LEADS_REI_MERGE_FIELD_ID = "fldU5SYnljXAnowVm"
 LEADS_REI_FALLBACK_FIELD_ID = "fldNcNTATOdOk8GOf"
 
+# Airtable takes 10 records per upsert and 5 requests/sec per base
+AIRTABLE_BATCH_SIZE = 10
+UPSERT_WORKERS = 5
+# At most this many GovCon batches wait between the SAM producer and the upsert consumers
+UPSERT_QUEUE_BATCHES = 8
+
+# /feeds/status is polled by dashboards; serve watermarks and recent runs from memory briefly.
+# Entries are key -> (expires_at, value); any feed commit in this process clears them.
+KV_CACHE_TTL_SECONDS = 2.0
+RECENT_RUNS_CACHE_TTL_SECONDS = 1.0
+_kv_cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+_recent_runs_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+_status_cache_lock = threading.Lock()
+
+# Airtable field -> SAM keys to try in order
+_FIELD_MAP: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("External_Id", ("noticeId", "id")),
+    ("Solicitation Number", ("solicitationNumber", "noticeId", "id")),
+    ("Title", ("title", "description")),
+    ("Posted Date", ("postedDate", "posted")),
+    ("Response Deadline", ("responseDeadLine", "responseDeadlines")),
+    ("Source_URL", ("uiLink", "url", "link")),
+    ("NAICS", ("naicsCode", "ncode")),
+    ("Set Aside", ("typeOfSetAside",)),
+    ("Notice Type", ("type",)),
+)
+
+# Fallback for date-only postedDate values on runtimes whose fromisoformat is stricter
+_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+
 
 class FeedError(Exception):
     ...
@@ -36,28 +91,63 @@ def _format_mmddyyyy(date: datetime.date) -> str:
     return date.strftime("%m/%d/%Y")
 
 
+def _as_utc(dt: datetime.datetime) -> datetime.datetime:
+    # SAM mixes date-only and offset timestamps; compare everything as aware UTC
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=datetime.timezone.utc)
+    return dt.astimezone(datetime.timezone.utc)
+
+
+@lru_cache(maxsize=4096)
 def _parse_posted_date(raw: str) -> Optional[datetime.datetime]:
-    for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%d"):
-        try:
-            return datetime.datetime.strptime(raw, fmt)
-        except ValueError:
-            continue
+    # SAM repeats the same postedDate across a page, so parses are cached by the raw string
+    try:
+        return _as_utc(datetime.datetime.fromisoformat(raw.replace("Z", "+00:00")))
+    except ValueError:
+        pass
+    m = _DATE_RE.match(raw)
+    if m:
+        return datetime.datetime(int(m[1]), int(m[2]), int(m[3]), tzinfo=datetime.timezone.utc)
     return None
 
 
+def _clear_status_cache() -> None:
+    with _status_cache_lock:
+        _kv_cache.clear()
+        _recent_runs_cache.clear()
+
+
+def _finish_write(session: Session, commit: bool) -> None:
+    # Feed runs flush as they go and commit once, together with their final ledger row
+    if commit:
+        session.commit()
+        _clear_status_cache()
+    else:
+        session.flush()
+
+
 def _get_kv(session: Session, key: str) -> Optional[Dict[str, Any]]:
+    with _status_cache_lock:
+        cached = _kv_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
     kv = session.get(OpsKV, key)
-    return kv.value_json if kv else None
+    value = kv.value_json if kv else None
+    with _status_cache_lock:
+        _kv_cache[key] = (time.monotonic() + KV_CACHE_TTL_SECONDS, value)
+    return value
 
 
-def _set_kv(session: Session, key: str, value: Dict[str, Any]) -> None:
+def _set_kv(session: Session, key: str, value: Dict[str, Any], *, commit: bool = False) -> None:
+    with _status_cache_lock:
+        _kv_cache.pop(key, None)
     kv = session.get(OpsKV, key)
     if kv:
         kv.value_json = value
     else:
         kv = OpsKV(key=key, value_json=value)
         session.add(kv)
-    session.commit()
+    _finish_write(session, commit)
 
 
 def _log_ledger(
@@ -71,30 +161,71 @@ def _log_ledger(
     cursor_value: Optional[str],
     error: Optional[str] = None,
     meta: Optional[Dict[str, Any]] = None,
+    commit: bool = False,
 ) -> None:
-    entry = OpsLedger(
-        run_id=run_id,
-        feed=feed,
-        status=status,
-        message=message,
-        error=error,
-        records_processed=records_processed,
-        cursor_value=cursor_value,
-        meta=meta,
+    # Core insert: the row is never read back, so skip building and tracking an ORM object
+    session.execute(
+        insert(OpsLedger.__table__),
+        [
+            {
+                "run_id": run_id,
+                "feed": feed,
+                "status": status,
+                "message": message,
+                "error": error,
+                "records_processed": records_processed,
+                "cursor_value": cursor_value,
+                "meta": meta,
+            }
+        ],
     )
-    session.add(entry)
-    session.commit()
+    _finish_write(session, commit)
 
 
-def _acquire_advisory_lock(session: Session, feed_name: str) -> bool:
-    key = advisory_lock_key(feed_name)
+@contextmanager
+def _feed_lock(session: Session, feed_name: str) -> Iterator[None]:
+    """
+    Hold the feed's session-level advisory lock for the whole run, raising FeedError if another
+    run has it. The lock lives on its own connection so the run's commits can't drop it, and is
+    released in finally. Databases without advisory locks (e.g. SQLite) run unlocked.
+    """
+    bind = session.get_bind()
+    if bind.dialect.name != "postgresql":
+        yield
+        return
+
+    namespace, lock_id = advisory_lock_key(feed_name)
+    params = {"ns": namespace, "id": lock_id}
+    conn = bind.connect()
     try:
-        locked = session.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": key}).scalar()
-        return bool(locked)
-    except Exception:
-        # If DB does not support advisory locks (e.g., SQLite), continue without locking
-        logger.warning("Advisory lock not supported; proceeding without lock", exc_info=True)
-        return True
+        locked = conn.execute(text("SELECT pg_try_advisory_lock(:ns, :id)"), params).scalar()
+        if not locked:
+            raise FeedError("Failed to acquire advisory lock")
+        try:
+            yield
+        finally:
+            try:
+                conn.execute(text("SELECT pg_advisory_unlock(:ns, :id)"), params)
+            except Exception:
+                # Dropping the server session releases the lock as well
+                logger.warning(f"Advisory unlock failed for {feed_name}; discarding connection", exc_info=True)
+                conn.invalidate()
+    finally:
+        conn.close()
+
+
+@lru_cache(maxsize=1)
+def _static_sam_params() -> Tuple[Tuple[str, str], ...]:
+    """Query params that only depend on config, with the NAICS list pre-joined; built once."""
+    params = [("api_key", config.SAM_API_KEY)]
+    if config.GOVCON_PTYPE:
+        params.append(("ptype", config.GOVCON_PTYPE))
+    naics_codes = config.get_naics_codes()
+    if naics_codes:
+        params.append(("ncode", ",".join(naics_codes)))
+    if config.GOVCON_SETASIDE:
+        params.append(("typeOfSetAside", config.GOVCON_SETASIDE))
+    return tuple(params)
 
 
 def _sam_query_params(
@@ -106,66 +237,225 @@ def _sam_query_params(
     offset: int,
     limit: int,
 ) -> Dict[str, Any]:
-    params: Dict[str, Any] = {
+    """Base params for a run; _iter_sam_pages only swaps in the offset per page."""
+    return {
         "postedFrom": posted_from,
         "postedTo": posted_to,
         "rdlfrom": rdl_from,
         "rdlto": rdl_to,
-        "limit": min(limit, 1000),
+        "limit": min(limit, SAM_PAGE_LIMIT),
         "offset": offset,
-        "api_key": config.SAM_API_KEY,
+        **dict(_static_sam_params()),
     }
-    if config.GOVCON_PTYPE:
-        params["ptype"] = config.GOVCON_PTYPE
-    naics_codes = config.get_naics_codes()
-    if naics_codes:
-        params["ncode"] = ",".join(naics_codes)
-    if config.GOVCON_SETASIDE:
-        params["typeOfSetAside"] = config.GOVCON_SETASIDE
-    return params
 
 
 def _fetch_sam_page(params: Dict[str, Any]) -> Dict[str, Any]:
-    response = requests.get(SAM_ENDPOINT, params=params, timeout=30)
+    response = _SAM_SESSION.get(SAM_ENDPOINT, params=params, timeout=30)
     response.raise_for_status()
     return response.json()
 
 
+def _iter_sam_pages(params: Dict[str, Any]) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    Yield (offset after the page, page) for SAM opportunity pages, advancing offset by the rows
+    received until totalRecords is reached or a short page comes back. Notices already yielded
+    on an earlier page are dropped in case SAM shifts the window between requests, so a page
+    may come back empty.
+    """
+    limit = params["limit"]
+    offset = params.get("offset", 0)
+    seen_ids: Set[str] = set()
+    while True:
+        payload = _fetch_sam_page({**params, "offset": offset})
+        items = payload.get("opportunitiesData") or []
+        if not items:
+            return
+        page: List[Dict[str, Any]] = []
+        for item in items:
+            notice_id = item.get("noticeId") or item.get("id")
+            if notice_id:
+                if notice_id in seen_ids:
+                    continue
+                seen_ids.add(notice_id)
+            page.append(item)
+        offset += len(items)
+        yield offset, page
+        total = payload.get("totalRecords")
+        if len(items) < limit or (total is not None and offset >= int(total)):
+            return
+
+
+def _flush_buffer(
+    buf: List[Dict[str, Any]],
+    *,
+    table_id: str,
+    merge_field_id: str,
+    fallback_field_id: Optional[str],
+) -> int:
+    """
+    Upsert buffered records in 10-record chunks, up to UPSERT_WORKERS at once, and empty the buffer.
+    The per-base rate limiter inside upsert_records keeps the workers within Airtable's limit.
+    Returns the number of records saved.
+    """
+    if not buf:
+        return 0
+    chunks = [buf[i : i + AIRTABLE_BATCH_SIZE] for i in range(0, len(buf), AIRTABLE_BATCH_SIZE)]
+    buf.clear()
+    target = dict(table_id=table_id, merge_field_id=merge_field_id, fallback_field_id=fallback_field_id)
+
+    if len(chunks) == 1:
+        return _upsert_chunk(chunks[0], **target)
+    with ThreadPoolExecutor(max_workers=min(UPSERT_WORKERS, len(chunks))) as pool:
+        return sum(pool.map(lambda chunk: _upsert_chunk(chunk, **target), chunks))
+
+
+def _upsert_chunk(
+    chunk: List[Dict[str, Any]],
+    *,
+    table_id: str,
+    merge_field_id: str,
+    fallback_field_id: Optional[str],
+) -> int:
+    saved = upsert_records(
+        base_id=config.AIRTABLE_BASE_ID,
+        table_id=table_id,
+        token=config.AIRTABLE_PAT,
+        records=chunk,
+        merge_field_id=merge_field_id,
+        fallback_field_id=fallback_field_id,
+    )
+    return len(saved)
+
+
+def _chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
 def _normalize_govcon_record(raw: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[datetime.datetime]]:
-    notice_id = raw.get("noticeId") or raw.get("id")
-    solicitation = raw.get("solicitationNumber") or notice_id
-    title = raw.get("title") or raw.get("description")
-    posted_date = raw.get("postedDate") or raw.get("posted")
-    posted_dt = _parse_posted_date(posted_date) if posted_date else None
-    deadline = raw.get("responseDeadLine") or raw.get("responseDeadlines")
-    url = raw.get("uiLink") or raw.get("url") or raw.get("link")
-    naics = raw.get("naicsCode") or raw.get("ncode")
-    set_aside = raw.get("typeOfSetAside")
+    # Same result as chaining raw.get(a) or raw.get(b) or ... for each field
     fields = {
-        "External_Id": notice_id,
-        "Solicitation Number": solicitation,
-        "Title": title,
-        "Posted Date": posted_date,
-        "Response Deadline": deadline,
-        "Source_URL": url,
-        "NAICS": naics,
-        "Set Aside": set_aside,
-        "Notice Type": raw.get("type"),
+        field: next((raw[k] for k in keys if raw.get(k)), raw.get(keys[-1]))
+        for field, keys in _FIELD_MAP
     }
+    posted_date = fields["Posted Date"]
+    posted_dt = _parse_posted_date(posted_date) if posted_date else None
     return fields, posted_dt
 
 
+def _iter_normalized(
+    pages: Iterable[List[Dict[str, Any]]],
+    last_watermark: Optional[datetime.datetime],
+) -> Iterator[Tuple[Dict[str, Any], Optional[datetime.datetime]]]:
+    """
+    Normalize SAM items page by page, dropping those at or before the last watermark.
+    last_watermark must be aware UTC, like the parsed posted dates.
+    """
+    for items in pages:
+        normalized = [_normalize_govcon_record(item) for item in items]
+        if last_watermark:
+            # client-side filter to prevent skipping items due to date-only window; undated items are kept
+            normalized = [(record, dt) for record, dt in normalized if not dt or dt > last_watermark]
+        yield from normalized
+
+
+def _max_dt(*dts: Optional[datetime.datetime]) -> Optional[datetime.datetime]:
+    return max((dt for dt in dts if dt), default=None)
+
+
+async def _govcon_pipeline(
+    params: Dict[str, Any],
+    last_watermark: Optional[datetime.datetime],
+    progress: Dict[str, Any],
+    on_checkpoint: Callable[[int, Optional[datetime.datetime]], None],
+) -> None:
+    """
+    Fetch SAM pages and upsert them to Airtable concurrently: one producer walks the pages and
+    queues 10-record batches, UPSERT_WORKERS consumers drain the queue until they see the None
+    sentinel. Both sides run their blocking HTTP calls in threads. progress["processed"] and
+    progress["latest_seen"] are updated as batches land so a failed run can still report them.
+    Each time another leading run of pages is fully upserted, on_checkpoint(offset, latest posted
+    date in those pages) is run in a worker thread, one call at a time, with the newest values.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=UPSERT_QUEUE_BATCHES)
+    pages = _iter_sam_pages(params)
+    target = dict(
+        table_id=GOVCON_TABLE_ID,
+        merge_field_id=GOVCON_MERGE_FIELD_ID,
+        fallback_field_id=GOVCON_FALLBACK_FIELD_ID,
+    )
+    # page number -> [batches not yet upserted, offset after the page, latest posted date on the page]
+    in_flight: Dict[int, List[Any]] = {}
+    next_page = 0
+    done_latest = progress["checkpoint_latest"]
+    # Newest settled (offset, latest) and the last one handed to on_checkpoint
+    due: Optional[Tuple[int, Optional[datetime.datetime]]] = None
+    written: Optional[Tuple[int, Optional[datetime.datetime]]] = None
+    checkpoint_lock = asyncio.Lock()
+
+    async def settle() -> None:
+        nonlocal next_page, done_latest, due, written
+        while next_page in in_flight and in_flight[next_page][0] == 0:
+            _, offset, page_latest = in_flight.pop(next_page)
+            done_latest = _max_dt(done_latest, page_latest)
+            next_page += 1
+            due = (offset, done_latest)
+        if checkpoint_lock.locked():
+            # The task holding the lock writes whatever is due once its current write finishes
+            return
+        async with checkpoint_lock:
+            # The DB write blocks, so it runs off the loop; consumers keep upserting meanwhile
+            while due is not None and due != written:
+                current = due
+                await asyncio.to_thread(on_checkpoint, *current)
+                written = current
+
+    async def produce() -> None:
+        page_no = 0
+        while (page := await asyncio.to_thread(next, pages, None)) is not None:
+            offset, items = page
+            normalized = list(_iter_normalized([items], last_watermark))
+            page_latest = _max_dt(*(posted_dt for _, posted_dt in normalized))
+            progress["latest_seen"] = _max_dt(progress["latest_seen"], page_latest)
+            batches = list(_chunked([record for record, _ in normalized], AIRTABLE_BATCH_SIZE))
+            # Registered with its full count before any batch is queued, so it can't settle early
+            in_flight[page_no] = [len(batches), offset, page_latest]
+            if not batches:
+                await settle()
+            for batch in batches:
+                await queue.put((page_no, batch))
+            page_no += 1
+        # Not in a finally: if the producer fails, gather cancels the consumers instead, and a
+        # sentinel put into a full queue with no consumers left would never return
+        for _ in range(UPSERT_WORKERS):
+            await queue.put(None)
+
+    async def consume() -> None:
+        while (item := await queue.get()) is not None:
+            page_no, batch = item
+            saved = await asyncio.to_thread(_upsert_chunk, batch, **target)
+            progress["processed"] += saved
+            in_flight[page_no][0] -= 1
+            await settle()
+
+    await asyncio.gather(produce(), *(consume() for _ in range(UPSERT_WORKERS)))
+
+
 def run_govcon_feed(session: Session) -> Dict[str, Any]:
+    with _feed_lock(session, "govcon"):
+        return _run_govcon_feed(session)
+
+
+def _run_govcon_feed(session: Session) -> Dict[str, Any]:
     feed_name = "govcon"
     run_id = str(uuid.uuid4())
-    if not _acquire_advisory_lock(session, feed_name):
-        raise FeedError("Failed to acquire advisory lock")
 
     last_kv = _get_kv(session, f"{feed_name}:last_success")
     last_watermark = None
     if last_kv and "timestamp" in last_kv:
         try:
-            last_watermark = datetime.datetime.fromisoformat(last_kv["timestamp"])
+            last_watermark = _as_utc(datetime.datetime.fromisoformat(last_kv["timestamp"]))
         except ValueError:
             last_watermark = None
 
@@ -176,50 +466,41 @@ def run_govcon_feed(session: Session) -> Dict[str, Any]:
     rdl_from = config.GOVCON_RDL_FROM or posted_from
     rdl_to = config.GOVCON_RDL_TO or posted_to
 
-    limit = 1000
-    offset = 0
-    processed = 0
-    latest_seen: Optional[datetime.datetime] = last_watermark
-    collected_records: List[Dict[str, Any]] = []
+    window = {"posted_from": posted_from, "posted_to": posted_to, "rdl_from": rdl_from, "rdl_to": rdl_to}
+
+    # A failed run leaves a checkpoint; a retry over the same window resumes paging from it
+    checkpoint_key = f"{feed_name}:checkpoint"
+    checkpoint = _get_kv(session, checkpoint_key) or {}
+    start_offset = 0
+    checkpoint_latest = None
+    if checkpoint.get("window") == window:
+        start_offset = checkpoint.get("offset") or 0
+        if checkpoint.get("latest_seen"):
+            checkpoint_latest = _as_utc(datetime.datetime.fromisoformat(checkpoint["latest_seen"]))
+
+    def save_checkpoint(offset: int, latest: Optional[datetime.datetime]) -> None:
+        value = {"window": window, "offset": offset, "latest_seen": latest.isoformat() if latest else None}
+        _set_kv(session, checkpoint_key, value, commit=True)
+
+    params = _sam_query_params(
+        posted_from=posted_from,
+        posted_to=posted_to,
+        rdl_from=rdl_from,
+        rdl_to=rdl_to,
+        offset=start_offset,
+        limit=SAM_PAGE_LIMIT,
+    )
+    progress: Dict[str, Any] = {
+        "processed": 0,
+        "latest_seen": _max_dt(last_watermark, checkpoint_latest),
+        "checkpoint_latest": checkpoint_latest,
+    }
 
     try:
-        while True:
-            params = _sam_query_params(
-                posted_from=posted_from,
-                posted_to=posted_to,
-                rdl_from=rdl_from,
-                rdl_to=rdl_to,
-                offset=offset,
-                limit=limit,
-            )
-            payload = _fetch_sam_page(params)
-            items = payload.get("opportunitiesData", [])
-            if not items:
-                break
-
-            filtered: List[Dict[str, Any]] = []
-            for item in items:
-                record, posted_dt = _normalize_govcon_record(item)
-                if last_watermark and posted_dt and posted_dt <= last_watermark:
-                    # client-side filter to prevent skipping items due to date-only window
-                    continue
-                filtered.append(record)
-                if posted_dt and (latest_seen is None or posted_dt > latest_seen):
-                    latest_seen = posted_dt
-
-            if filtered:
-                saved = upsert_records(
-                    base_id=config.AIRTABLE_BASE_ID,
-                    table_id=GOVCON_TABLE_ID,
-                    token=config.AIRTABLE_PAT,
-                    records=filtered,
-                    merge_field_id=GOVCON_MERGE_FIELD_ID,
-                    fallback_field_id=GOVCON_FALLBACK_FIELD_ID,
-                )
-                processed += len(saved)
-            offset += 1
-            if len(items) < limit:
-                break
+        try:
+            asyncio.run(_govcon_pipeline(params, last_watermark, progress, save_checkpoint))
+        finally:
+            processed, latest_seen = progress["processed"], progress["latest_seen"]
     except Exception as exc:  # noqa: BLE001
         _log_ledger(
             session,
@@ -230,12 +511,14 @@ def run_govcon_feed(session: Session) -> Dict[str, Any]:
             error=str(exc),
             records_processed=processed,
             cursor_value=latest_seen.isoformat() if latest_seen else None,
-            meta={"posted_from": posted_from, "posted_to": posted_to, "rdl_from": rdl_from, "rdl_to": rdl_to},
+            meta={**window, "resumed_from_offset": start_offset},
+            commit=True,
         )
         raise
 
     if latest_seen:
         _set_kv(session, f"{feed_name}:last_success", {"timestamp": latest_seen.isoformat()})
+    _set_kv(session, checkpoint_key, {})
     _log_ledger(
         session,
         run_id=run_id,
@@ -244,13 +527,14 @@ def run_govcon_feed(session: Session) -> Dict[str, Any]:
         message="GovCon feed run complete",
         records_processed=processed,
         cursor_value=latest_seen.isoformat() if latest_seen else None,
-        meta={"posted_from": posted_from, "posted_to": posted_to, "rdl_from": rdl_from, "rdl_to": rdl_to},
+        meta={**window, "resumed_from_offset": start_offset},
+        commit=True,
     )
     return {
         "run_id": run_id,
         "processed": processed,
         "cursor": latest_seen.isoformat() if latest_seen else None,
-        "window": {"posted_from": posted_from, "posted_to": posted_to, "rdl_from": rdl_from, "rdl_to": rdl_to},
+        "window": window,
     }
 
 
@@ -258,40 +542,40 @@ def run_rei_feed(session: Session) -> Dict[str, Any]:
     """
     Placeholder REI feed to normalize source URLs and upsert idempotently to Leads_REI table.
     """
+    with _feed_lock(session, "rei"):
+        return _run_rei_feed(session)
+
+
+def _run_rei_feed(session: Session) -> Dict[str, Any]:
     feed_name = "rei"
     run_id = str(uuid.uuid4())
-    if not _acquire_advisory_lock(session, feed_name):
-        raise FeedError("Failed to acquire advisory lock")
 
     sources = config.get_rei_sources()
     processed = 0
-    normalized_records: List[Dict[str, Any]] = []
+    # Keyed by External_Id so repeated sources collapse to one upsert (last one wins)
+    records_by_id: Dict[str, Dict[str, Any]] = {}
     for source in sources:
         url = source.get("url")
         external_id = source.get("external_id") or url
         if not url or not external_id:
             continue
         # normalize url (strip fragments/query for idempotence)
-        normalized_url = url.split("#")[0]
-        normalized_records.append(
-            {
-                "External_Id": external_id,
-                "Source_URL": normalized_url,
-                "Raw_Source": source,
-            }
-        )
+        parts = urlsplit(url)
+        normalized_url = urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+        records_by_id[external_id] = {
+            "External_Id": external_id,
+            "Source_URL": normalized_url,
+            "Raw_Source": source,
+        }
+    normalized_records = list(records_by_id.values())
 
     try:
-        if normalized_records:
-            saved = upsert_records(
-                base_id=config.AIRTABLE_BASE_ID,
-                table_id=LEADS_REI_TABLE_ID,
-                token=config.AIRTABLE_PAT,
-                records=normalized_records,
-                merge_field_id=LEADS_REI_MERGE_FIELD_ID,
-                fallback_field_id=LEADS_REI_FALLBACK_FIELD_ID,
-            )
-            processed = len(saved)
+        processed = _flush_buffer(
+            normalized_records,
+            table_id=LEADS_REI_TABLE_ID,
+            merge_field_id=LEADS_REI_MERGE_FIELD_ID,
+            fallback_field_id=LEADS_REI_FALLBACK_FIELD_ID,
+        )
     except Exception as exc:  # noqa: BLE001
         _log_ledger(
             session,
@@ -303,6 +587,7 @@ def run_rei_feed(session: Session) -> Dict[str, Any]:
             records_processed=processed,
             cursor_value=None,
             meta={"sources": len(sources)},
+            commit=True,
         )
         raise
 
@@ -315,6 +600,7 @@ def run_rei_feed(session: Session) -> Dict[str, Any]:
         records_processed=processed,
         cursor_value=None,
         meta={"sources": len(sources)},
+        commit=True,
     )
     return {"run_id": run_id, "processed": processed}
 
@@ -324,6 +610,12 @@ def get_feed_status(session: Session) -> Dict[str, Any]:
         "govcon": _get_kv(session, "govcon:last_success"),
         "rei": _get_kv(session, "rei:last_success"),
     }
+    with _status_cache_lock:
+        cached = _recent_runs_cache.get("recent_runs")
+    if cached and cached[0] > time.monotonic():
+        status["recent_runs"] = cached[1]
+        return status
+
     recent = (
         session.query(OpsLedger)
         .order_by(OpsLedger.created_at.desc())
@@ -342,4 +634,6 @@ def get_feed_status(session: Session) -> Dict[str, Any]:
         }
         for r in recent
     ]
+    with _status_cache_lock:
+        _recent_runs_cache["recent_runs"] = (time.monotonic() + RECENT_RUNS_CACHE_TTL_SECONDS, status["recent_runs"])
     return status
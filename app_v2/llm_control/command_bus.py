@@ -1,49 +1,165 @@
-print("COMMAND_BUS_LOADED_WITH_REI_RUN_HANDLER")
+import importlib
+import queue
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
-from typing import Dict, Any
+import orjson
+from fastapi import APIRouter, HTTPException, Request
 
-from fastapi import APIRouter
-from pydantic import BaseModel
+from app_v2.utils.logger import get_logger
+
+logger = get_logger(__name__)
+logger.debug("Command bus loaded with REI run handler")
 
 router = APIRouter()
 
+# At most one REI run waiting behind the one in progress; further requests are refused
+_REI_QUEUE: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=1)
+_rei_worker: Optional[threading.Thread] = None
+_rei_worker_lock = threading.Lock()
 
-class Command(BaseModel):
-    engine: str
-    action: str
-    payload: Dict[str, Any] = {}
 
+# Imported on first use so importing the command bus stays cheap; warm_up() loads it off the request path.
+# A plain import is thread-safe: a run arriving mid-warm-up blocks on the module's import lock
+# until the module is fully initialised instead of seeing a half-loaded one.
+REI_ENGINE_MODULE = "engines.rei_engine"
 
-@router.post("/command")
-async def llm_command(cmd: Command):
-    """
-    Minimal, safe V2 LLM command bus.
 
-    - No external imports (Airtable, Twilio, normalizers, scorers, etc.).
-    - Guarantees a clean JSON response for dev/health.
-    - Other commands return a structured "unsupported_command" error for now.
-    """
+def warm_up() -> None:
+    """Import the engine modules ahead of the first command; called from a startup thread."""
+    try:
+        importlib.import_module(REI_ENGINE_MODULE)
+    except Exception:
+        # REI commands would hit the same import error; surface it at boot rather than per run
+        logger.exception("Command bus warm-up failed")
+
+
+def _rei_consumer() -> None:
+    while True:
+        payload = _REI_QUEUE.get()
+        try:
+            importlib.import_module(REI_ENGINE_MODULE).run_rei_engine(payload=payload)
+        except Exception:
+            logger.exception("REI run failed")
+
+
+def _ensure_rei_worker() -> None:
+    global _rei_worker
+    if _rei_worker is not None:
+        return
+    with _rei_worker_lock:
+        if _rei_worker is None:
+            _rei_worker = threading.Thread(target=_rei_consumer, name="rei-command-worker", daemon=True)
+            _rei_worker.start()
+
+
+class Command:
+    """/command body, decoded straight from the raw bytes with orjson (no per-request model validation)."""
+
+    __slots__ = ("engine", "action", "payload")
+
+    def __init__(self, engine: str, action: str, payload: Optional[Dict[str, Any]] = None):
+        self.engine = engine
+        self.action = action
+        self.payload = payload if payload is not None else {}
+
+    @classmethod
+    def decode(cls, body: bytes) -> "Command":
+        """Raise ValueError if the body is not {"engine": str, "action": str, "payload"?: object}."""
+        data = orjson.loads(body)
+        if not isinstance(data, dict):
+            raise ValueError("command body must be a JSON object")
+        engine, action, payload = data.get("engine"), data.get("action"), data.get("payload")
+        if not isinstance(engine, str) or not isinstance(action, str):
+            raise ValueError("engine and action must be strings")
+        if payload is not None and not isinstance(payload, dict):
+            raise ValueError("payload must be an object")
+        return cls(engine, action, payload)
+
+
+# Body schema for the docs, since the endpoint reads the raw request instead of a pydantic model
+_COMMAND_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "required": ["engine", "action"],
+                    "properties": {
+                        "engine": {"type": "string"},
+                        "action": {"type": "string"},
+                        "payload": {"type": "object", "default": {}},
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+Handler = Callable[[Command], Awaitable[Dict[str, Any]]]
+
+# (engine, action) -> handler; filled by @register below
+HANDLERS: Dict[Tuple[str, str], Handler] = {}
 
+
+def register(engine: str, action: str) -> Callable[[Handler], Handler]:
+    def decorator(handler: Handler) -> Handler:
+        HANDLERS[(engine, action)] = handler
+        return handler
+
+    return decorator
+
+
+@register("dev", "health")
+async def _dev_health(cmd: Command) -> Dict[str, Any]:
     # Health check for V2 control layer
-    if cmd.engine == "dev" and cmd.action == "health":
-        return {
-            "status": "ok",
-            "engine": cmd.engine,
-            "action": cmd.action,
-            "message": "V2 LLM command bus is reachable",
-        }
+    return {
+        "status": "ok",
+        "engine": cmd.engine,
+        "action": cmd.action,
+        "message": "V2 LLM command bus is reachable",
+    }
 
-    # REI engine dispatch
-    if cmd.engine == "rei" and cmd.action == "run":
-        print("REI RUN COMMAND HANDLER HIT")
-        from engines.rei_engine import run_rei_engine
 
-        run_rei_engine(payload=cmd.payload)
+@register("rei", "run")
+async def _rei_run(cmd: Command) -> Dict[str, Any]:
+    logger.debug("REI run command received")
+    _ensure_rei_worker()
+    try:
+        _REI_QUEUE.put_nowait(cmd.payload)
+    except queue.Full:
         return {
-            "status": "dispatched",
+            "status": "already_running",
             "engine": "rei",
             "action": "run",
         }
+    return {
+        "status": "dispatched",
+        "engine": "rei",
+        "action": "run",
+    }
+
+
+@router.post("/command", openapi_extra=_COMMAND_OPENAPI)
+async def llm_command(request: Request):
+    """
+    Minimal, safe V2 LLM command bus.
+
+    - No external imports (Airtable, Twilio, normalizers, scorers, etc.).
+    - Guarantees a clean JSON response for dev/health.
+    - Commands are dispatched through HANDLERS; anything unregistered returns
+      a structured "unsupported_command" error for now.
+    """
+    try:
+        cmd = Command.decode(await request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    handler = HANDLERS.get((cmd.engine, cmd.action))
+    if handler is not None:
+        return await handler(cmd)
 
     # Stub for everything else (you can expand this later)
     return {
@@ -1,7 +1,164 @@
-from typing import Any, Dict
-
-
-def repair_code(payload: Dict[str, Any]) -> Dict[str, Any]:
+import difflib
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+from app_v2.llm_control.schema_map import SCHEMA
+
+# Canned responses per error category: read-only and shared, built once at
+# import. Callers that need to mutate one should copy it with dict().
+_SCHEMA_MISMATCH_RESPONSE: Mapping[str, Any] = MappingProxyType({
+    "category": "schema_mismatch",
+    "hint": (
+        "Airtable field name mismatch. Check that payload keys match exact field names in Airtable. "
+        "Common issues: case sensitivity, underscores vs spaces, field renamed in Airtable."
+    ),
+    "suggested_action": "inspect_schema_map_and_update_field_mapping",
+    "auto_fix_available": False,
+    "debug_steps": (
+        "1. Check app_v2/llm_control/schema_map.py for correct field names",
+        "2. Compare payload keys against Airtable schema",
+        "3. Update engine to use correct field names",
+        "4. Retry operation",
+    ),
+})
+
+_PERMISSIONS_RESPONSE: Mapping[str, Any] = MappingProxyType({
+    "category": "permissions",
+    "hint": (
+        "Airtable API permission issue. Verify Personal Access Token (PAT) has correct scopes "
+        "and access to the base."
+    ),
+    "suggested_action": "verify_airtable_pat_scopes_and_base_access",
+    "auto_fix_available": False,
+    "debug_steps": (
+        "1. Go to Airtable → Account → Developer Hub → Personal access tokens",
+        "2. Verify token has these scopes: data.records:read, data.records:write, schema.bases:read",
+        "3. Verify token has access to KRIZZY_OPS_CRM base",
+        "4. Regenerate token if needed and update AIRTABLE_API_KEY env var",
+    ),
+})
+
+_NETWORK_RESPONSE: Mapping[str, Any] = MappingProxyType({
+    "category": "network",
+    "hint": (
+        "Network connectivity issue. Could be temporary outage, DNS problem, or firewall blocking."
+    ),
+    "suggested_action": "apply_retry_with_exponential_backoff",
+    "auto_fix_available": True,
+    "debug_steps": (
+        "1. Check internet connectivity",
+        "2. Verify Airtable API is accessible (https://api.airtable.com/)",
+        "3. Check for firewall/proxy blocking",
+        "4. V2 will auto-retry with backoff",
+    ),
+})
+
+_RATE_LIMIT_RESPONSE: Mapping[str, Any] = MappingProxyType({
+    "category": "rate_limit",
+    "hint": (
+        "Airtable rate limit exceeded (5 requests/second per base). "
+        "V2 needs to slow down API calls."
+    ),
+    "suggested_action": "apply_rate_limiting_backoff",
+    "auto_fix_available": True,
+    "debug_steps": (
+        "1. V2 will automatically backoff for 30 seconds",
+        "2. Consider batching operations",
+        "3. Increase engine intervals in config.py",
+    ),
+})
+
+_DISCORD_WEBHOOK_RESPONSE: Mapping[str, Any] = MappingProxyType({
+    "category": "discord_webhook",
+    "hint": "Discord webhook delivery failed. Non-critical - system continues.",
+    "suggested_action": "verify_discord_webhook_url",
+    "auto_fix_available": False,
+    "debug_steps": (
+        "1. Check DISCORD_WEBHOOK_OPS and DISCORD_WEBHOOK_ERRORS env vars",
+        "2. Test webhooks manually with curl",
+        "3. Verify webhooks not rate-limited by Discord",
+    ),
+})
+
+_TWILIO_DELIVERY_RESPONSE: Mapping[str, Any] = MappingProxyType({
+    "category": "twilio_delivery",
+    "hint": (
+        "Twilio delivery issue. Could be carrier filtering, compliance violation, or bad number."
+    ),
+    "suggested_action": "review_twilio_error_code_and_adjust_messaging",
+    "auto_fix_available": False,
+    "debug_steps": (
+        "1. Check Twilio logs for specific error code",
+        "2. If 30007: Review message content for spam triggers",
+        "3. If 30008: Verify number formatting",
+        "4. Rotate message templates in outbound_control_engine",
+    ),
+})
+
+_GMAIL_API_RESPONSE: Mapping[str, Any] = MappingProxyType({
+    "category": "gmail_api",
+    "hint": "Gmail API authentication or quota issue.",
+    "suggested_action": "refresh_gmail_oauth_token",
+    "auto_fix_available": False,
+    "debug_steps": (
+        "1. Check GMAIL_CREDENTIALS_JSON and GMAIL_TOKEN_JSON env vars",
+        "2. Verify OAuth2 token hasn't expired",
+        "3. Re-authenticate if needed",
+        "4. Check Gmail API quota in Google Cloud Console",
+    ),
+})
+
+_CONCURRENCY_RESPONSE: Mapping[str, Any] = MappingProxyType({
+    "category": "concurrency",
+    "hint": "Thread synchronization issue. Possible deadlock or race condition.",
+    "suggested_action": "review_thread_locks_and_restart_engine",
+    "auto_fix_available": True,
+    "debug_steps": (
+        "1. Thread supervisor will auto-restart crashed engine",
+        "2. Check logs for lock acquisition patterns",
+        "3. If persistent, review engine code for lock ordering",
+    ),
+})
+
+_UNKNOWN_DEBUG_STEPS = (
+    "1. Review full stack trace in logs",
+    "2. Check engine-specific logs",
+    "3. Update dev_agent.py with new error pattern",
+    "4. File issue if reproducible bug",
+)
+
+# (group name, trigger terms, response) in priority order: the first category
+# with any term present in the error wins, same as the old if-chain.
+_CATEGORIES = (
+    ("schema", ("unprocessable entity", "422", "invalid field", "unknown field"), _SCHEMA_MISMATCH_RESPONSE),
+    ("perm", ("invalid_permissions", "403", "forbidden", "not authorized"), _PERMISSIONS_RESPONSE),
+    ("network", ("connection", "timeout", "network", "unreachable"), _NETWORK_RESPONSE),
+    ("rate", ("429", "rate limit", "too many requests"), _RATE_LIMIT_RESPONSE),
+    ("discord", ("discord", "webhook"), _DISCORD_WEBHOOK_RESPONSE),
+    ("twilio", ("twilio", "30007", "sms delivery"), _TWILIO_DELIVERY_RESPONSE),
+    ("gmail", ("gmail", "google api", "oauth"), _GMAIL_API_RESPONSE),
+    ("concurrency", ("thread", "deadlock", "lock"), _CONCURRENCY_RESPONSE),
+)
+
+# One compiled pattern: each branch is an empty named group guarded by a
+# lookahead for that category's terms, so match.lastgroup names the
+# highest-priority category present anywhere in the error. Matching is
+# case-insensitive, so the (possibly long) error is never lowercased.
+_CATEGORY_RX = re.compile(
+    "|".join(
+        rf"(?=.*?(?:{'|'.join(map(re.escape, terms))}))(?P<{name}>)"
+        for name, terms, _ in _CATEGORIES
+    ),
+    re.I | re.S,
+)
+_CATEGORY_TO_RESPONSE: Dict[str, Mapping[str, Any]] = {
+    name: response for name, _, response in _CATEGORIES
+}
+
+
+def repair_code(payload: Dict[str, Any]) -> Mapping[str, Any]:
     """
     Interpret error messages and return concrete repair actions for V2.
 
@@ -14,139 +171,12 @@ def repair_code(payload: Dict[str, Any]) -> Dict[str, Any]:
       - hint: human-readable explanation
       - suggested_action: concrete next step
       - auto_fix_available: bool (if V2 can auto-repair)
-    """
-    error = str(payload.get("error", "")).lower()
-    context = payload.get("context", {})
-
-    # Schema/field mismatch errors
-    if any(term in error for term in ["unprocessable entity", "422", "invalid field", "unknown field"]):
-        return {
-            "category": "schema_mismatch",
-            "hint": (
-                "Airtable field name mismatch. Check that payload keys match exact field names in Airtable. "
-                "Common issues: case sensitivity, underscores vs spaces, field renamed in Airtable."
-            ),
-            "suggested_action": "inspect_schema_map_and_update_field_mapping",
-            "auto_fix_available": False,
-            "debug_steps": [
-                "1. Check app_v2/llm_control/schema_map.py for correct field names",
-                "2. Compare payload keys against Airtable schema",
-                "3. Update engine to use correct field names",
-                "4. Retry operation",
-            ],
-        }
-
-    # Permission errors
-    if any(term in error for term in ["invalid_permissions", "403", "forbidden", "not authorized"]):
-        return {
-            "category": "permissions",
-            "hint": (
-                "Airtable API permission issue. Verify Personal Access Token (PAT) has correct scopes "
-                "and access to the base."
-            ),
-            "suggested_action": "verify_airtable_pat_scopes_and_base_access",
-            "auto_fix_available": False,
-            "debug_steps": [
-                "1. Go to Airtable → Account → Developer Hub → Personal access tokens",
-                "2. Verify token has these scopes: data.records:read, data.records:write, schema.bases:read",
-                "3. Verify token has access to KRIZZY_OPS_CRM base",
-                "4. Regenerate token if needed and update AIRTABLE_API_KEY env var",
-            ],
-        }
-
-    # Network/connection errors
-    if any(term in error for term in ["connection", "timeout", "network", "unreachable"]):
-        return {
-            "category": "network",
-            "hint": (
-                "Network connectivity issue. Could be temporary outage, DNS problem, or firewall blocking."
-            ),
-            "suggested_action": "apply_retry_with_exponential_backoff",
-            "auto_fix_available": True,
-            "debug_steps": [
-                "1. Check internet connectivity",
-                "2. Verify Airtable API is accessible (https://api.airtable.com/)",
-                "3. Check for firewall/proxy blocking",
-                "4. V2 will auto-retry with backoff",
-            ],
-        }
-
-    # Rate limiting
-    if any(term in error for term in ["429", "rate limit", "too many requests"]):
-        return {
-            "category": "rate_limit",
-            "hint": (
-                "Airtable rate limit exceeded (5 requests/second per base). "
-                "V2 needs to slow down API calls."
-            ),
-            "suggested_action": "apply_rate_limiting_backoff",
-            "auto_fix_available": True,
-            "debug_steps": [
-                "1. V2 will automatically backoff for 30 seconds",
-                "2. Consider batching operations",
-                "3. Increase engine intervals in config.py",
-            ],
-        }
-
-    # Discord webhook errors
-    if any(term in error for term in ["discord", "webhook"]):
-        return {
-            "category": "discord_webhook",
-            "hint": "Discord webhook delivery failed. Non-critical - system continues.",
-            "suggested_action": "verify_discord_webhook_url",
-            "auto_fix_available": False,
-            "debug_steps": [
-                "1. Check DISCORD_WEBHOOK_OPS and DISCORD_WEBHOOK_ERRORS env vars",
-                "2. Test webhooks manually with curl",
-                "3. Verify webhooks not rate-limited by Discord",
-            ],
-        }
 
-    # Twilio errors
-    if any(term in error for term in ["twilio", "30007", "sms delivery"]):
-        return {
-            "category": "twilio_delivery",
-            "hint": (
-                "Twilio delivery issue. Could be carrier filtering, compliance violation, or bad number."
-            ),
-            "suggested_action": "review_twilio_error_code_and_adjust_messaging",
-            "auto_fix_available": False,
-            "debug_steps": [
-                "1. Check Twilio logs for specific error code",
-                "2. If 30007: Review message content for spam triggers",
-                "3. If 30008: Verify number formatting",
-                "4. Rotate message templates in outbound_control_engine",
-            ],
-        }
-
-    # Gmail API errors
-    if any(term in error for term in ["gmail", "google api", "oauth"]):
-        return {
-            "category": "gmail_api",
-            "hint": "Gmail API authentication or quota issue.",
-            "suggested_action": "refresh_gmail_oauth_token",
-            "auto_fix_available": False,
-            "debug_steps": [
-                "1. Check GMAIL_CREDENTIALS_JSON and GMAIL_TOKEN_JSON env vars",
-                "2. Verify OAuth2 token hasn't expired",
-                "3. Re-authenticate if needed",
-                "4. Check Gmail API quota in Google Cloud Console",
-            ],
-        }
-
-    # Thread/concurrency errors
-    if any(term in error for term in ["thread", "deadlock", "lock"]):
-        return {
-            "category": "concurrency",
-            "hint": "Thread synchronization issue. Possible deadlock or race condition.",
-            "suggested_action": "review_thread_locks_and_restart_engine",
-            "auto_fix_available": True,
-            "debug_steps": [
-                "1. Thread supervisor will auto-restart crashed engine",
-                "2. Check logs for lock acquisition patterns",
-                "3. If persistent, review engine code for lock ordering",
-            ],
-        }
+    Known categories return a shared read-only mapping; copy before mutating.
+    """
+    category = _repair_for(str(payload.get("error", "")))
+    if category:
+        return _CATEGORY_TO_RESPONSE[category]
 
     # Unknown error
     return {
@@ -154,15 +184,32 @@ def repair_code(payload: Dict[str, Any]) -> Dict[str, Any]:
         "hint": f"Unhandled error pattern. Full error: {payload.get('error', 'N/A')}",
         "suggested_action": "manual_review_and_update_dev_agent",
         "auto_fix_available": False,
-        "debug_steps": [
-            "1. Review full stack trace in logs",
-            "2. Check engine-specific logs",
-            "3. Update dev_agent.py with new error pattern",
-            "4. File issue if reproducible bug",
-        ],
+        "debug_steps": _UNKNOWN_DEBUG_STEPS,
     }
 
 
+@lru_cache(maxsize=1024)
+def _repair_for(error: str) -> Optional[str]:
+    """Category group name for an error, or None; retries repeat the same strings."""
+    m = _CATEGORY_RX.match(error)
+    return m.lastgroup if m else None
+
+
+def _normalize_field(name: str) -> str:
+    return name.lower().replace("_", "").replace(" ", "")
+
+
+# {table: {normalized name: [original names]}}; a bucket can hold several
+# originals that differ only by case/underscores (e.g. Address vs address).
+_NORMALIZED_SCHEMA: Dict[str, Dict[str, List[str]]] = {}
+for _table, _fields in SCHEMA.items():
+    _buckets: Dict[str, List[str]] = {}
+    for _field in _fields:
+        _buckets.setdefault(_normalize_field(_field), []).append(_field)
+    _NORMALIZED_SCHEMA[_table] = _buckets
+del _table, _fields, _buckets, _field
+
+
 def suggest_schema_fix(table: str, failed_fields: list) -> Dict[str, Any]:
     """
     Suggest field name corrections for schema mismatches.
@@ -171,32 +218,27 @@ def suggest_schema_fix(table: str, failed_fields: list) -> Dict[str, Any]:
       - table: Airtable table name
       - failed_fields: list of field names that failed
 
-    Returns suggested corrections based on common patterns.
+    Returns suggested corrections: exact normalized matches, else the closest
+    names ranked by similarity.
     """
-    from app_v2.llm_control.schema_map import SCHEMA
-
     if table not in SCHEMA:
         return {
             "status": "unknown_table",
             "message": f"Table '{table}' not in schema_map.py",
         }
 
-    valid_fields = SCHEMA[table]
+    buckets = _NORMALIZED_SCHEMA[table]
     suggestions = {}
 
     for failed_field in failed_fields:
-        # Try to find close matches
-        lower_failed = failed_field.lower().replace("_", "").replace(" ", "")
-
-        matches = []
-        for valid_field in valid_fields:
-            lower_valid = valid_field.lower().replace("_", "").replace(" ", "")
-            if lower_failed == lower_valid:
-                matches.append(valid_field)
-            elif lower_failed in lower_valid or lower_valid in lower_failed:
-                matches.append(valid_field)
-
-        suggestions[failed_field] = matches if matches else ["No close match found"]
+        norm = _normalize_field(failed_field)
+        matches = buckets.get(norm)
+        if not matches:
+            # Nearest normalized names by similarity, best first
+            close = difflib.get_close_matches(norm, buckets.keys(), n=3, cutoff=0.7)
+            matches = [field for key in close for field in buckets[key]]
+
+        suggestions[failed_field] = list(matches) if matches else ["No close match found"]
 
     return {
         "status": "suggestions_generated",
@@ -1,5 +1,33 @@
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Pattern
+
+# Compiled once at import; each normalizer just runs .search()
+
+_RX_REI_ADDRESS = re.compile(r"\d{1,6}\s[\w\s\.]+")
+_RX_REI_ASKING = re.compile(r"asking[:\s]*\$?([\d,]+)", re.I)
+_RX_REI_ARV = re.compile(r"arv[:\s]*\$?([\d,]+)", re.I)
+_RX_REI_REPAIRS = re.compile(r"repairs?[:\s]*\$?([\d,]+)", re.I)
+_RX_REI_CITY = re.compile(r"(?:city|in)[:\s]*([\w\s]+)", re.I)
+# State and ZIP located in one pass; the two never overlap (letters vs digits)
+_RX_REI_LOCATORS = re.compile(r"\b(?:(?P<state>[A-Z]{2})|(?P<zip>\d{5}(?:-\d{4})?))\b")
+
+_RX_GOVCON_NAICS = re.compile(r"\b(\d{6})\b")
+_RX_GOVCON_DUE_DATE = re.compile(r"(?:due|deadline|response)[:\s]*([A-Za-z0-9,\s/-]+?)(?:\.|$)", re.I)
+_RX_GOVCON_SET_ASIDE = re.compile(r"set[- ]aside[:\s]*([\w\s/]+?)(?:\.|$)", re.I)
+_RX_GOVCON_TITLE = re.compile(r"(?:title|solicitation)[:\s]*([\w\s]+?)(?:\.|$)", re.I)
+_RX_GOVCON_AGENCY = re.compile(r"agency[:\s]*([\w\s]+?)(?:\.|$)", re.I)
+
+_RX_BUYER_NAME = re.compile(r"(?:name|buyer)[:\s]*([\w\s]+?)(?:\.|$)", re.I)
+# Market state and phone located in one pass; the two never overlap
+_RX_BUYER_LOCATORS = re.compile(
+    r"\b(?P<state>[A-Z]{2})\b|(?P<phone>(?:\+1[-\s]?)?\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4})"
+)
+_RX_BUYER_EMAIL = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+_RX_BUYER_MARKET_CITY = re.compile(r"(?:market|city|looking in)[:\s]*([\w\s]+?)(?:\.|,|$)", re.I)
+_RX_BUYER_MIN_PRICE = re.compile(r"(?:min|minimum|from)[:\s]*\$?([\d,]+)", re.I)
+_RX_BUYER_MAX_PRICE = re.compile(r"(?:max|maximum|to|up to)[:\s]*\$?([\d,]+)", re.I)
+_RX_BUYER_REHAB = re.compile(r"(?:rehab|renovation)[:\s]*(light|moderate|heavy)", re.I)
+_RX_BUYER_STRATEGY = re.compile(r"(?:strategy|looking for)[:\s]*(flip|rental|wholesale|buy and hold)", re.I)
 
 
 def normalize_rei(raw: Dict[str, Any]) -> Dict[str, Any]:
@@ -15,15 +43,16 @@ def normalize_rei(raw: Dict[str, Any]) -> Dict[str, Any]:
       - notes (original text)
     """
     text = str(raw.get("text", "")).strip()
+    located = _extract_fields(text, _RX_REI_LOCATORS)
 
     return {
-        "address": _extract(text, r"\d{1,6}\s[\w\s\.]+"),
-        "asking": _extract_money(text, r"(?i)asking[:\s]*\$?([\d,]+)"),
-        "arv": _extract_money(text, r"(?i)arv[:\s]*\$?([\d,]+)"),
-        "repairs": _extract_money(text, r"(?i)repairs?[:\s]*\$?([\d,]+)"),
-        "city": _extract(text, r"(?i)(?:city|in)[:\s]*([\w\s]+)"),
-        "state": _extract(text, r"\b([A-Z]{2})\b"),
-        "zip": _extract(text, r"\b(\d{5}(?:-\d{4})?)\b"),
+        "address": _extract(text, _RX_REI_ADDRESS),
+        "asking": _extract_money(text, _RX_REI_ASKING),
+        "arv": _extract_money(text, _RX_REI_ARV),
+        "repairs": _extract_money(text, _RX_REI_REPAIRS),
+        "city": _extract(text, _RX_REI_CITY),
+        "state": located["state"],
+        "zip": located["zip"],
         "notes": text,
     }
 
@@ -42,11 +71,11 @@ def normalize_govcon(raw: Dict[str, Any]) -> Dict[str, Any]:
     text = str(raw.get("text", "")).strip()
 
     return {
-        "naics": _extract(text, r"\b(\d{6})\b"),
-        "due_date": _extract(text, r"(?i)(?:due|deadline|response)[:\s]*([A-Za-z0-9,\s/-]+?)(?:\.|$)"),
-        "set_aside": _extract(text, r"(?i)set[- ]aside[:\s]*([\w\s/]+?)(?:\.|$)"),
-        "title": _extract(text, r"(?i)(?:title|solicitation)[:\s]*([\w\s]+?)(?:\.|$)"),
-        "agency": _extract(text, r"(?i)agency[:\s]*([\w\s]+?)(?:\.|$)"),
+        "naics": _extract(text, _RX_GOVCON_NAICS),
+        "due_date": _extract(text, _RX_GOVCON_DUE_DATE),
+        "set_aside": _extract(text, _RX_GOVCON_SET_ASIDE),
+        "title": _extract(text, _RX_GOVCON_TITLE),
+        "agency": _extract(text, _RX_GOVCON_AGENCY),
         "description": text,
     }
 
@@ -65,32 +94,47 @@ def normalize_buyer(raw: Dict[str, Any]) -> Dict[str, Any]:
       - rehab_appetite, strategy
     """
     text = str(raw.get("text", "")).strip()
+    located = _extract_fields(text, _RX_BUYER_LOCATORS)
 
     return {
-        "name": _extract(text, r"(?i)(?:name|buyer)[:\s]*([\w\s]+?)(?:\.|$)"),
-        "phone": _extract(text, r"(?:\+1[-\s]?)?\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}"),
-        "email": _extract(text, r"[\w\.-]+@[\w\.-]+\.\w+"),
-        "market_city": _extract(text, r"(?i)(?:market|city|looking in)[:\s]*([\w\s]+?)(?:\.|,|$)"),
-        "market_state": _extract(text, r"\b([A-Z]{2})\b"),
-        "min_price": _extract_money(text, r"(?i)(?:min|minimum|from)[:\s]*\$?([\d,]+)"),
-        "max_price": _extract_money(text, r"(?i)(?:max|maximum|to|up to)[:\s]*\$?([\d,]+)"),
-        "rehab_appetite": _extract(text, r"(?i)(?:rehab|renovation)[:\s]*(light|moderate|heavy)"),
-        "strategy": _extract(text, r"(?i)(?:strategy|looking for)[:\s]*(flip|rental|wholesale|buy and hold)"),
+        "name": _extract(text, _RX_BUYER_NAME),
+        "phone": located["phone"],
+        "email": _extract(text, _RX_BUYER_EMAIL),
+        "market_city": _extract(text, _RX_BUYER_MARKET_CITY),
+        "market_state": located["state"],
+        "min_price": _extract_money(text, _RX_BUYER_MIN_PRICE),
+        "max_price": _extract_money(text, _RX_BUYER_MAX_PRICE),
+        "rehab_appetite": _extract(text, _RX_BUYER_REHAB),
+        "strategy": _extract(text, _RX_BUYER_STRATEGY),
     }
 
 
-def _extract(text: str, pattern: str) -> Optional[str]:
-    """Extract first match from text using regex pattern"""
-    m = re.search(pattern, text)
+def _extract(text: str, pattern: Pattern[str]) -> Optional[str]:
+    """Extract first match from text using a compiled regex pattern"""
+    m = pattern.search(text)
     if not m:
         return None
     result = m.group(1) if m.groups() else m.group(0)
     return result.strip() if result else None
 
 
-def _extract_money(text: str, pattern: str) -> Optional[float]:
+def _extract_fields(text: str, pattern: Pattern[str]) -> Dict[str, Optional[str]]:
+    """First match of each named group in one finditer pass (None if absent)"""
+    found: Dict[str, Optional[str]] = dict.fromkeys(pattern.groupindex)
+    remaining = len(found)
+    for m in pattern.finditer(text):
+        name = m.lastgroup
+        if found[name] is None:
+            found[name] = m.group(name).strip()
+            remaining -= 1
+            if not remaining:
+                break
+    return found
+
+
+def _extract_money(text: str, pattern: Pattern[str]) -> Optional[float]:
     """Extract monetary value from text and convert to float"""
-    m = re.search(pattern, text)
+    m = pattern.search(text)
     if not m:
         return None
     raw = m.group(1) if m.groups() else m.group(0)
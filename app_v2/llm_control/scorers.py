@@ -1,4 +1,37 @@
-from typing import Any, Dict
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Pattern, Tuple
+
+import numpy as np
+
+
+def _phrase_rx(*phrases: str) -> Pattern[str]:
+    """One compiled alternation over literal phrases (a single scan per search)."""
+    return re.compile("|".join(map(re.escape, phrases)))
+
+
+# GovCon description/title keywords, each counted at most once
+_GOVCON_KEYWORDS_RX = _phrase_rx(
+    "maintenance", "repair", "construction", "consulting", "it services",
+    "software", "cybersecurity", "cloud", "infrastructure",
+)
+
+# score_rei_batch recommendation indices map into this tuple (same thresholds as score_rei)
+_REI_RECOMMENDATIONS = ("assign", "wholesale", "rental", "trash")
+
+# Buyer liquidity signal groups: (pattern, points), each group counted once
+_LIQUIDITY_SIGNALS = (
+    (_phrase_rx("cash", "wire", "proof of funds"), 30),
+    (_phrase_rx("closes fast", "7 days", "quick close"), 20),
+    (_phrase_rx("hard money", "private lender"), 10),
+)
+
+# Buyer intent tiers, checked high -> medium -> low
+_INTENT_TIERS = (
+    ("high", _phrase_rx("actively buying", "buying now", "ready to close")),
+    ("medium", _phrase_rx("looking", "interested", "considering")),
+    ("low", _phrase_rx("maybe", "just browsing", "not sure")),
+)
 
 
 def score_rei(deal: Dict[str, Any]) -> Dict[str, Any]:
@@ -17,6 +50,19 @@ def score_rei(deal: Dict[str, Any]) -> Dict[str, Any]:
     arv = _to_float(deal.get("arv") or deal.get("ARV"))
     repairs = _to_float(deal.get("repairs") or deal.get("Repairs"))
 
+    mao, spread, spread_ratio, score, recommendation = _score_rei_core(asking, arv, repairs)
+    return {
+        "mao": mao,
+        "spread": spread,
+        "spread_ratio": spread_ratio,
+        "score": score,
+        "recommendation": recommendation,
+    }
+
+
+@lru_cache(maxsize=4096)
+def _score_rei_core(asking: float, arv: float, repairs: float) -> Tuple[float, float, float, int, str]:
+    """Cached REI math; returns (mao, spread, spread_ratio, score, recommendation)."""
     mao = 0.70 * arv - repairs
     spread = arv - asking - repairs
     spread_ratio = spread / arv if arv > 0 else 0.0
@@ -31,13 +77,50 @@ def score_rei(deal: Dict[str, Any]) -> Dict[str, Any]:
     else:
         recommendation = "trash"
 
-    return {
-        "mao": round(mao, 2),
-        "spread": round(spread, 2),
-        "spread_ratio": round(spread_ratio, 4),
-        "score": _score_spread(spread),
-        "recommendation": recommendation,
-    }
+    return (
+        round(mao, 2),
+        round(spread, 2),
+        round(spread_ratio, 4),
+        _score_spread(spread),
+        recommendation,
+    )
+
+
+def score_rei_batch(deals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Vectorized score_rei over a list of deals (same keys, math and thresholds).
+    Prefer this when scoring many deals at once.
+    """
+    if not deals:
+        return []
+
+    asking = np.array([_to_float(d.get("asking") or d.get("Asking")) for d in deals], dtype=np.float64)
+    arv = np.array([_to_float(d.get("arv") or d.get("ARV")) for d in deals], dtype=np.float64)
+    repairs = np.array([_to_float(d.get("repairs") or d.get("Repairs")) for d in deals], dtype=np.float64)
+
+    mao = 0.70 * arv - repairs
+    spread = arv - asking - repairs
+    spread_ratio = np.divide(spread, arv, out=np.zeros_like(spread), where=arv > 0)
+
+    score = np.select(
+        [spread >= 50000, spread >= 30000, spread >= 15000, spread >= 5000, spread >= 0],
+        [90, 75, 60, 40, 20],
+        default=0,
+    )
+    rec_idx = np.select([spread >= 50000, spread >= 30000, spread >= 10000], [0, 1, 2], default=3)
+
+    return [
+        {
+            "mao": round(d_mao, 2),
+            "spread": round(d_spread, 2),
+            "spread_ratio": round(d_ratio, 4),
+            "score": d_score,
+            "recommendation": _REI_RECOMMENDATIONS[d_rec],
+        }
+        for d_mao, d_spread, d_ratio, d_score, d_rec in zip(
+            mao.tolist(), spread.tolist(), spread_ratio.tolist(), score.tolist(), rec_idx.tolist()
+        )
+    ]
 
 
 def score_govcon(op: Dict[str, Any]) -> Dict[str, Any]:
@@ -48,13 +131,26 @@ def score_govcon(op: Dict[str, Any]) -> Dict[str, Any]:
       - score: 0-100 numeric score
       - recommendation: "bid" or "skip"
     """
-    score = 0
-
     # Extract fields (handle case variations)
     naics = str(op.get("naics") or op.get("NAICS") or "")
     set_aside = str(op.get("set_aside") or op.get("Set_Aside") or "").lower()
     desc = str(op.get("description") or op.get("Description") or "").lower()
     title = str(op.get("title") or op.get("Title") or "").lower()
+    estimated_value = _to_float(op.get("estimated_value") or op.get("Estimated_Value"))
+
+    score, recommendation = _score_govcon_core(naics, set_aside, desc, title, estimated_value)
+    return {
+        "score": score,
+        "recommendation": recommendation,
+    }
+
+
+@lru_cache(maxsize=4096)
+def _score_govcon_core(
+    naics: str, set_aside: str, desc: str, title: str, estimated_value: float
+) -> Tuple[int, str]:
+    """Cached GovCon scoring on the normalized fields; returns (score, recommendation)."""
+    score = 0
 
     # NAICS scoring (IT/construction/services)
     high_value_naics = {"236220", "238160", "561720", "541330", "541511", "541512", "541519"}
@@ -66,16 +162,11 @@ def score_govcon(op: Dict[str, Any]) -> Dict[str, Any]:
     if any(term in set_aside for term in favorable_set_asides):
         score += 25
 
-    # Keyword scoring in description/title
-    favorable_keywords = [
-        "maintenance", "repair", "construction", "consulting", "it services",
-        "software", "cybersecurity", "cloud", "infrastructure"
-    ]
-    keyword_count = sum(1 for kw in favorable_keywords if kw in desc or kw in title)
+    # Keyword scoring in description/title; NUL keeps matches from spanning the two
+    keyword_count = len(set(_GOVCON_KEYWORDS_RX.findall(desc + "\x00" + title)))
     score += min(20, keyword_count * 5)
 
     # Estimated value scoring (if available)
-    estimated_value = _to_float(op.get("estimated_value") or op.get("Estimated_Value"))
     if estimated_value >= 100000:
         score += 15
     elif estimated_value >= 50000:
@@ -86,10 +177,7 @@ def score_govcon(op: Dict[str, Any]) -> Dict[str, Any]:
 
     recommendation = "bid" if score >= 50 else "skip"
 
-    return {
-        "score": score,
-        "recommendation": recommendation,
-    }
+    return score, recommendation
 
 
 def score_buyer(buyer: Dict[str, Any]) -> Dict[str, Any]:
@@ -104,27 +192,27 @@ def score_buyer(buyer: Dict[str, Any]) -> Dict[str, Any]:
     # Flatten all values to searchable text
     tags = " ".join(str(v).lower() for v in buyer.values() if v)
 
+    liquidity_score, intent, tier = _score_buyer_core(tags)
+    return {
+        "liquidity_score": liquidity_score,
+        "intent": intent,
+        "tier_recommendation": tier,
+    }
+
+
+@lru_cache(maxsize=4096)
+def _score_buyer_core(tags: str) -> Tuple[int, str, str]:
+    """Cached buyer scoring on the flattened tags; returns (liquidity_score, intent, tier)."""
     liquidity_score = 40  # Base score
 
     # Liquidity signals
-    if "cash" in tags or "wire" in tags or "proof of funds" in tags:
-        liquidity_score += 30
-    if "closes fast" in tags or "7 days" in tags or "quick close" in tags:
-        liquidity_score += 20
-    if "hard money" in tags or "private lender" in tags:
-        liquidity_score += 10
+    liquidity_score += sum(points for rx, points in _LIQUIDITY_SIGNALS if rx.search(tags))
 
     # Cap at 100
     liquidity_score = min(100, liquidity_score)
 
     # Intent signals
-    intent = "unknown"
-    if any(phrase in tags for phrase in ["actively buying", "buying now", "ready to close"]):
-        intent = "high"
-    elif any(phrase in tags for phrase in ["looking", "interested", "considering"]):
-        intent = "medium"
-    elif any(phrase in tags for phrase in ["maybe", "just browsing", "not sure"]):
-        intent = "low"
+    intent = next((level for level, rx in _INTENT_TIERS if rx.search(tags)), "unknown")
 
     # Tier recommendation
     if liquidity_score >= 80 and intent == "high":
@@ -134,11 +222,7 @@ def score_buyer(buyer: Dict[str, Any]) -> Dict[str, Any]:
     else:
         tier = "C"
 
-    return {
-        "liquidity_score": liquidity_score,
-        "intent": intent,
-        "tier_recommendation": tier,
-    }
+    return liquidity_score, intent, tier
 
 
 def _to_float(v: Any) -> float:
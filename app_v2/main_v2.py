@@ -1,23 +1,46 @@
+import asyncio
+import threading
+from functools import lru_cache
+from importlib import import_module
+
 from fastapi import FastAPI
 from app_v2 import config
 from app_v2.models.system_state import system_state
 from app_v2.loop_orchestrator import start_orchestrator
 from app_v2.thread_supervisor import supervisor
-from app_v2.utils.logger import get_logger
+from app_v2.utils.logger import configure_logging, get_logger
 
 # Import engines
 from app_v2.engines.input_engine import input_loop
 from app_v2.engines.underwriting_engine import underwriting_loop
 
-# Import LLM control router
-from app_v2.llm_control.command_bus import router as llm_router
-
+configure_logging()
 logger = get_logger(__name__)
 
 app = FastAPI(title="KRIZZY OPS V2", version="2.0.0")
 
-# Mount LLM command bus
-app.include_router(llm_router, prefix="/v2/llm", tags=["llm_control"])
+
+def _mount_llm_router() -> None:
+    """Import and mount the LLM command bus; deferred so importing the app stays cheap"""
+    command_bus = import_module("app_v2.llm_control.command_bus")
+    app.include_router(command_bus.router, prefix="/v2/llm", tags=["llm_control"])
+    # Load the command bus's lazy engine modules in the background instead of on the first command
+    asyncio.get_running_loop().run_in_executor(None, command_bus.warm_up)
+
+
+@lru_cache(maxsize=1)
+def _manual_input_engine():
+    from app_v2.engines.input_engine import InputEngine
+    return InputEngine()
+
+
+# InputEngine isn't thread-safe; overlapping manual triggers take turns on the shared engine
+_manual_input_lock = threading.Lock()
+
+
+def _run_manual_input_cycle():
+    with _manual_input_lock:
+        return _manual_input_engine().run_input_cycle()
 
 
 @app.on_event("startup")
@@ -25,6 +48,9 @@ async def startup():
     """Initialize system on startup"""
     logger.info("Starting KRIZZY OPS V2 system...")
 
+    # Mount LLM command bus before serving traffic
+    _mount_llm_router()
+
     # Start dynamic interval orchestrator
     start_orchestrator()
 
@@ -53,31 +79,56 @@ def health():
 
 
 @app.get("/metrics")
-def metrics():
+async def metrics():
     """System metrics"""
-    return system_state.get_status()
+    # get_status takes the state lock; keep the event loop free while waiting on it
+    return await asyncio.to_thread(system_state.get_status)
 
 
 @app.post("/trigger/input")
-def trigger_input():
+async def trigger_input():
     """Manual trigger for input engine (one cycle)"""
-    from app_v2.engines.input_engine import InputEngine
-    engine = InputEngine()
-    result = engine.run_input_cycle()
+    # One engine reused across triggers, so patches left pending by a failed flush are retried
+    # Airtable-bound cycle runs off the event loop
+    result = await asyncio.to_thread(_run_manual_input_cycle)
     return {"status": "ok", **result}
 
 
 @app.post("/trigger/underwriting")
-def trigger_underwriting():
+async def trigger_underwriting():
     """Manual trigger for underwriting engine (one cycle)"""
     from app_v2.engines.underwriting_engine import run_underwriting_cycle
-    result = run_underwriting_cycle()
+    result = await asyncio.to_thread(run_underwriting_cycle)
     return {"status": "ok", **result}
 
 
+@app.post("/trigger/cycle")
+async def trigger_cycle():
+    """
+    Manual trigger for one input cycle and one underwriting cycle, run concurrently.
+    Underwriting picks up leads staged by earlier input cycles, like the supervised loops do.
+    """
+    from app_v2.engines.underwriting_engine import run_underwriting_cycle
+    input_result, underwriting_result = await asyncio.gather(
+        asyncio.to_thread(_run_manual_input_cycle),
+        asyncio.to_thread(run_underwriting_cycle),
+    )
+    return {"status": "ok", "input": input_result, "underwriting": underwriting_result}
+
+
 if __name__ == "__main__":
     import os
+    import sys
     import uvicorn
 
     port = int(os.getenv("PORT", "8080"))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("UVICORN_WORKERS", "1"))
+    # uvicorn needs an import string to spawn more than one worker
+    uvicorn.run(
+        "app_v2.main_v2:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=port,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=workers,
+    )
@@ -6,3 +6,4 @@ from app_v2.models.ledger import Ledger
 from app_v2.models.job import Job
 from app_v2.models.pending_deal import PendingDeal
 from app_v2.models.ops import OpsKV, OpsLedger
+from app_v2.models.worker_status import WorkerStatus
@@ -1,18 +1,23 @@
 from datetime import datetime
 import hashlib
+from typing import Tuple
 from sqlalchemy import Column, DateTime, Integer, String, JSON, Text, Boolean, Index
 from sqlalchemy.sql import func
 
 from app_v2.database import Base
 
 
-def advisory_lock_key(name: str) -> int:
+# First half of the two-int advisory lock key; keeps feed locks apart from any other lock users
+FEED_LOCK_NAMESPACE = 0x4F505346  # "OPSF"
+
+
+def advisory_lock_key(name: str) -> Tuple[int, int]:
     """
-    Derive a stable bigint advisory lock key from feed name.
-    Uses the first 8 bytes of sha256 digest.
+    Derive a stable (namespace, id) advisory lock key from feed name.
+    The id is a 4-byte blake2b digest read as signed so it fits Postgres int4.
     """
-    digest = hashlib.sha256(name.encode("utf-8")).digest()
-    return int.from_bytes(digest[:8], "big", signed=False)
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=4).digest()
+    return FEED_LOCK_NAMESPACE, int.from_bytes(digest, "big", signed=True)
 
 
 class OpsKV(Base):
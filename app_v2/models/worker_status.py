@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer
+
+from app_v2.database import Base
+
+# The v2 worker keeps exactly one status row
+WORKER_STATUS_ID = 1
+
+
+class WorkerStatus(Base):
+    __tablename__ = "worker_status"
+
+    id = Column(Integer, primary_key=True)
+
+    # Liveness: bumped on every heartbeat flush without inserting rows
+    last_seen_at = Column(DateTime(timezone=True), nullable=True)
+    ticks = Column(Integer, nullable=False, default=0)
+
+    # hash() of the last observed (errors, runs, inbound velocity) snapshot
+    state_hash = Column(BigInteger, nullable=True)
@@ -1,8 +1,18 @@
+import asyncio
+import atexit
+import threading
+import time
+
+import aiohttp
 import requests
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Optional, Tuple
 from app_v2 import config
 from app_v2.utils.logger import get_logger
 from app_v2.utils.airtable_schema import filter_fields, refresh_schema
+from app_v2.utils.http_errors import to_requests_error
+from app_v2.utils.rate_limit import get_rate_limiter
 
 logger = get_logger(__name__)
 
@@ -12,29 +22,91 @@ HEADERS = {
     "Content-Type": "application/json"
 }
 
+# One keep-alive pool for every Airtable call. Transient 429/5xx are retried for reads and PATCH
+# (replaying a PATCH is harmless); POST is never retried so a create can't be duplicated.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.25,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "PATCH"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+atexit.register(_SESSION.close)
+
+# Airtable allows 5 requests/sec per base; never have more than that in flight
+MAX_CONCURRENT_REQUESTS = 5
+
+# Engines poll the same staging views every cycle; serve repeats from memory for a short while.
+# Entries are (table, filter_formula, max_records, fields) -> (expires_at, records); writes to a table drop its entries.
+READ_CACHE_TTL_SECONDS = 30
+_read_cache: Dict[Tuple[str, Optional[str], Optional[int], Optional[Tuple[str, ...]]], Tuple[float, List[Dict[str, Any]]]] = {}
+_read_cache_lock = threading.Lock()
+
+
+def invalidate_read_cache(table: str) -> None:
+    """Drop cached reads for a table; called after every write to it."""
+    with _read_cache_lock:
+        for key in [k for k in _read_cache if k[0] == table]:
+            del _read_cache[key]
+
 
 def read_records(
     table: str,
     filter_formula: Optional[str] = None,
-    max_records: Optional[int] = None
+    max_records: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    page_size: int = 100
 ) -> List[Dict[str, Any]]:
-    """Read records from Airtable table"""
+    """
+    Read records from Airtable table, following pagination up to max_records.
+    fields limits the columns returned. Results are cached for READ_CACHE_TTL_SECONDS.
+    """
+    cache_key = (table, filter_formula, max_records, tuple(fields) if fields else None)
+    with _read_cache_lock:
+        cached = _read_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return list(cached[1])
+
     url = f"{API_BASE}/{config.AIRTABLE_BASE_ID}/{table}"
-    params = {}
+    params: Dict[str, Any] = {"pageSize": min(page_size, 100)}
 
     if filter_formula:
         params["filterByFormula"] = filter_formula
     if max_records:
         params["maxRecords"] = max_records
+    if fields:
+        params["fields[]"] = list(fields)
 
+    records: List[Dict[str, Any]] = []
     try:
-        response = requests.get(url, headers=HEADERS, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json().get("records", [])
+        while True:
+            get_rate_limiter(config.AIRTABLE_BASE_ID).acquire()
+            response = _SESSION.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+            records.extend(data.get("records", []))
+            # Airtable stops handing out offsets once maxRecords is reached
+            offset = data.get("offset")
+            if not offset:
+                break
+            params["offset"] = offset
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to read from {table}: {e}")
         raise
 
+    with _read_cache_lock:
+        _read_cache[cache_key] = (time.monotonic() + READ_CACHE_TTL_SECONDS, records)
+    return list(records)
+
 
 def write_record(table: str, fields: Dict[str, Any]) -> Dict[str, Any]:
     """Create a new record in Airtable table"""
@@ -43,18 +115,22 @@ def write_record(table: str, fields: Dict[str, Any]) -> Dict[str, Any]:
     payload = {"fields": filtered}
 
     try:
-        response = requests.post(url, headers=HEADERS, json=payload, timeout=10)
+        get_rate_limiter(config.AIRTABLE_BASE_ID).acquire()
+        response = _SESSION.post(url, json=payload, timeout=10)
         if response.status_code == 422:
             logger.warning(f"Airtable 422 on POST to {table}: {response.text}")
             refresh_schema(config.AIRTABLE_BASE_ID, config.AIRTABLE_API_KEY)
             filtered = filter_fields(fields, table, config.AIRTABLE_BASE_ID, config.AIRTABLE_API_KEY)
             payload = {"fields": filtered}
-            response = requests.post(url, headers=HEADERS, json=payload, timeout=10)
+            get_rate_limiter(config.AIRTABLE_BASE_ID).acquire()
+            response = _SESSION.post(url, json=payload, timeout=10)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to write to {table}: {e}")
         raise
+    finally:
+        invalidate_read_cache(table)
 
 
 def update_record(table: str, record_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
@@ -64,18 +140,22 @@ def update_record(table: str, record_id: str, fields: Dict[str, Any]) -> Dict[st
     payload = {"fields": filtered}
 
     try:
-        response = requests.patch(url, headers=HEADERS, json=payload, timeout=10)
+        get_rate_limiter(config.AIRTABLE_BASE_ID).acquire()
+        response = _SESSION.patch(url, json=payload, timeout=10)
         if response.status_code == 422:
             logger.warning(f"Airtable 422 on PATCH to {table}/{record_id}: {response.text}")
             refresh_schema(config.AIRTABLE_BASE_ID, config.AIRTABLE_API_KEY)
             filtered = filter_fields(fields, table, config.AIRTABLE_BASE_ID, config.AIRTABLE_API_KEY)
             payload = {"fields": filtered}
-            response = requests.patch(url, headers=HEADERS, json=payload, timeout=10)
+            get_rate_limiter(config.AIRTABLE_BASE_ID).acquire()
+            response = _SESSION.patch(url, json=payload, timeout=10)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to update {table}/{record_id}: {e}")
         raise
+    finally:
+        invalidate_read_cache(table)
 
 
 def batch_create(table: str, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -92,7 +172,8 @@ def batch_create(table: str, records: List[Dict[str, Any]]) -> List[Dict[str, An
         payload = {"records": filtered_chunk}
 
         try:
-            response = requests.post(url, headers=HEADERS, json=payload, timeout=10)
+            get_rate_limiter(config.AIRTABLE_BASE_ID).acquire()
+            response = _SESSION.post(url, json=payload, timeout=10)
             if response.status_code == 422:
                 logger.warning(f"Airtable 422 on batch create to {table}: {response.text}")
                 refresh_schema(config.AIRTABLE_BASE_ID, config.AIRTABLE_API_KEY)
@@ -101,11 +182,115 @@ def batch_create(table: str, records: List[Dict[str, Any]]) -> List[Dict[str, An
                     for r in chunk
                 ]
                 payload = {"records": filtered_chunk}
-                response = requests.post(url, headers=HEADERS, json=payload, timeout=10)
+                get_rate_limiter(config.AIRTABLE_BASE_ID).acquire()
+                response = _SESSION.post(url, json=payload, timeout=10)
             response.raise_for_status()
             created.extend(response.json().get("records", []))
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to batch create in {table}: {e}")
             raise
+        finally:
+            invalidate_read_cache(table)
 
     return created
+
+
+def _filter_update_chunk(table: str, chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "records": [
+            {"id": r["id"], "fields": filter_fields(r["fields"], table, config.AIRTABLE_BASE_ID, config.AIRTABLE_API_KEY)}
+            for r in chunk
+        ]
+    }
+
+
+def _update_chunk(table: str, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """PATCH one chunk of up to 10 records, refreshing the schema and retrying once on 422"""
+    url = f"{API_BASE}/{config.AIRTABLE_BASE_ID}/{table}"
+    payload = _filter_update_chunk(table, chunk)
+
+    try:
+        get_rate_limiter(config.AIRTABLE_BASE_ID).acquire()
+        response = _SESSION.patch(url, json=payload, timeout=10)
+        if response.status_code == 422:
+            logger.warning(f"Airtable 422 on batch update to {table}: {response.text}")
+            return _retry_update_chunk(table, chunk)
+        response.raise_for_status()
+        return response.json().get("records", [])
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Failed to batch update in {table}: {e}")
+        raise
+
+
+def _retry_update_chunk(table: str, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """After a 422: refresh the schema, refilter the chunk and PATCH it once more"""
+    url = f"{API_BASE}/{config.AIRTABLE_BASE_ID}/{table}"
+    refresh_schema(config.AIRTABLE_BASE_ID, config.AIRTABLE_API_KEY)
+    payload = _filter_update_chunk(table, chunk)
+    get_rate_limiter(config.AIRTABLE_BASE_ID).acquire()
+    response = _SESSION.patch(url, json=payload, timeout=10)
+    response.raise_for_status()
+    return response.json().get("records", [])
+
+
+async def _aupdate_chunks(table: str, chunks: List[List[Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+    """PATCH all chunks concurrently, at most MAX_CONCURRENT_REQUESTS in flight"""
+    url = f"{API_BASE}/{config.AIRTABLE_BASE_ID}/{table}"
+    # Filter up front so a schema fetch never blocks inside the event loop
+    payloads = [_filter_update_chunk(table, chunk) for chunk in chunks]
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    limiter = get_rate_limiter(config.AIRTABLE_BASE_ID)
+
+    async def send(session: aiohttp.ClientSession, chunk: List[Dict[str, Any]], payload: Dict[str, Any]):
+        async with sem:
+            await limiter.acquire_async()
+            async with session.patch(url, json=payload) as r:
+                schema_drift = r.status == 422
+                if not schema_drift:
+                    r.raise_for_status()
+                    return (await r.json()).get("records", [])
+                logger.warning(f"Airtable 422 on batch update to {table}: {await r.text()}")
+        # Schema drift: refresh and send only the refiltered retry (not the stale payload again)
+        return await asyncio.to_thread(_retry_update_chunk, table, chunk)
+
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_REQUESTS, keepalive_timeout=60)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=HEADERS) as session:
+        return await asyncio.gather(*(send(session, chunk, payload) for chunk, payload in zip(chunks, payloads)))
+
+
+def _loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+def update_records_bulk(table: str, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Batch update records given as {"id", "fields"} (max 10 per call per Airtable API).
+    Multiple chunks are sent concurrently when no event loop is running in this thread.
+    """
+    chunks = [records[i:i + 10] for i in range(0, len(records), 10)]
+    updated: List[Dict[str, Any]] = []
+
+    try:
+        if len(chunks) > 1 and not _loop_running():
+            try:
+                results = asyncio.run(_aupdate_chunks(table, chunks))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Failed to batch update in {table}: {e}")
+                # Same exception types as the sync path
+                raise to_requests_error(e) from e
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Failed to batch update in {table}: {e}")
+                raise
+        else:
+            results = [_update_chunk(table, chunk) for chunk in chunks]
+    finally:
+        invalidate_read_cache(table)
+
+    for chunk_records in results:
+        updated.extend(chunk_records)
+    return updated
@@ -9,9 +9,12 @@ from __future__ import annotations
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from app_v2.utils.logger import get_logger
+from app_v2.utils.rate_limit import get_rate_limiter
 
 logger = get_logger(__name__)
 
@@ -21,6 +24,10 @@ TABLE_URL = "https://api.airtable.com/v0/{base_id}/{table_id}"
 SCHEMA_CACHE: Dict[Tuple[str, str], Dict[str, Any]] = {}
 SCHEMA_TTL_SECONDS = 300
 
+# Shared keep-alive pool; feeds upsert many chunks back-to-back
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
 
 def _auth_headers(token: str) -> Dict[str, str]:
     return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
@@ -33,7 +40,8 @@ def fetch_table_schema(base_id: str, table_id: str, token: str, *, force: bool =
     if cached and not force and (now - cached.get("_ts", 0)) < SCHEMA_TTL_SECONDS:
         return cached
 
-    resp = requests.get(META_URL.format(base_id=base_id), headers=_auth_headers(token), timeout=15)
+    get_rate_limiter(base_id).acquire()
+    resp = _SESSION.get(META_URL.format(base_id=base_id), headers=_auth_headers(token), timeout=15)
     resp.raise_for_status()
     data = resp.json()
     schema: Dict[str, Any] = {}
@@ -86,7 +94,8 @@ def _perform_upsert(
         "performUpsert": {"fieldsToMergeOn": [merge_field]},
         "records": [{"fields": r} for r in records],
     }
-    resp = requests.post(url, headers=_auth_headers(token), json=payload, timeout=30)
+    get_rate_limiter(base_id).acquire()
+    resp = _SESSION.post(url, headers=_auth_headers(token), data=orjson.dumps(payload), timeout=30)
     if resp.status_code == 429:
         raise RateLimitError(resp)
     if resp.status_code == 422:
@@ -95,6 +104,28 @@ def _perform_upsert(
     return resp.json().get("records", [])
 
 
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _should_retry(err: Exception) -> bool:
+    """Retry only transient failures: throttling, 5xx, dropped connections and timeouts."""
+    if isinstance(err, requests.HTTPError):
+        status = getattr(err.response, "status_code", None)
+        return status in RETRYABLE_STATUS_CODES
+    return isinstance(err, (requests.ConnectionError, requests.Timeout))
+
+
+def _retry_delay(response: Optional[requests.Response], attempt: int, backoff_seconds: int) -> float:
+    """Honor Airtable's Retry-After when present, else back off linearly."""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return max(backoff_seconds, backoff_seconds * attempt)
+
+
 class RateLimitError(Exception):
     def __init__(self, response: requests.Response):
         self.response = response
@@ -136,9 +167,9 @@ def upsert_records(
             try:
                 saved.extend(_perform_upsert(base_id, table_id, token, filtered, merge_field))
                 break
-            except RateLimitError:
+            except RateLimitError as err:
                 attempt += 1
-                delay = max(backoff_seconds, backoff_seconds * attempt)
+                delay = _retry_delay(err.response, attempt, backoff_seconds)
                 logger.warning(f"Airtable 429 received; sleeping {delay}s before retry (attempt {attempt})")
                 time.sleep(delay)
                 continue
@@ -152,9 +183,12 @@ def upsert_records(
                 attempt += 1
                 continue
             except requests.RequestException as err:
+                if not _should_retry(err):
+                    logger.error(f"Airtable upsert failed with non-retryable error: {err}")
+                    raise
                 attempt += 1
                 logger.error(f"Airtable upsert error attempt {attempt}: {err}")
-                time.sleep(backoff_seconds)
+                time.sleep(_retry_delay(err.response, attempt, backoff_seconds))
                 continue
         else:
             raise RuntimeError(f"Failed to upsert chunk after {max_retries} attempts")
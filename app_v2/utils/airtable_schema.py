@@ -5,6 +5,8 @@ import requests
 import time
 from typing import Dict, Any, Set
 
+from app_v2.utils.rate_limit import get_rate_limiter
+
 _schema_cache: Dict[str, Set[str]] = {}
 _cache_timestamp: float = 0.0
 CACHE_TTL_SECONDS = 300
@@ -21,6 +23,7 @@ def fetch_schema(base_id: str, api_key: str, force_refresh: bool = False) -> Dic
     url = f"https://api.airtable.com/v0/meta/bases/{base_id}/tables"
     headers = {"Authorization": f"Bearer {api_key}"}
 
+    get_rate_limiter(base_id).acquire()
     response = requests.get(url, headers=headers, timeout=10)
     response.raise_for_status()
 
@@ -1,16 +1,21 @@
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
 from app_v2 import config
 from app_v2.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Shared keep-alive pool so alerts don't pay a TLS handshake each time
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
 
 def post_to_discord(webhook_url: str, message: str) -> bool:
     """Post message to Discord webhook"""
     try:
         payload = {"content": message[:2000]}  # Discord limit
-        response = requests.post(webhook_url, json=payload, timeout=5)
+        response = _SESSION.post(webhook_url, json=payload, timeout=5)
         response.raise_for_status()
         return True
     except requests.exceptions.RequestException as e:
@@ -0,0 +1,21 @@
+"""
+Map aiohttp failures onto requests exceptions.
+
+The Airtable writers send multi-chunk batches concurrently with aiohttp but single
+chunks with requests; converting at the boundary lets callers catch one exception type.
+"""
+import asyncio
+
+import aiohttp
+import requests
+
+
+def to_requests_error(exc: BaseException) -> requests.exceptions.RequestException:
+    """The requests exception equivalent to an aiohttp (or aiohttp timeout) error."""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return requests.exceptions.HTTPError(f"{exc.status} {exc.message} for url: {exc.request_info.real_url}")
+    if isinstance(exc, asyncio.TimeoutError):
+        return requests.exceptions.Timeout(str(exc) or "Request timed out")
+    if isinstance(exc, aiohttp.ClientConnectionError):
+        return requests.exceptions.ConnectionError(str(exc))
+    return requests.exceptions.RequestException(str(exc))
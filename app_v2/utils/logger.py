@@ -2,14 +2,16 @@ import logging
 import sys
 from typing import Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+
+def configure_logging(level: int = logging.INFO):
+    """Install the stdout handler; call once from the app entrypoint, not at import"""
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        handlers=[
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
 
 
 def get_logger(name: str) -> logging.Logger:
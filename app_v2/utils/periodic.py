@@ -0,0 +1,51 @@
+"""
+Drift-corrected scheduling for the 24/7 engine loops.
+
+Sleep only for what's left of the interval after the cycle's own work, so a
+slow cycle is followed by a short (or no) wait instead of a full interval.
+"""
+import gc
+import time
+from typing import Callable
+
+# Doubling stops after this many consecutive empty cycles (2**5 = 32x the base interval, before capping)
+MAX_BACKOFF_DOUBLINGS = 5
+
+# Force a full collection every this many cycles, or after any cycle that handled more records than this
+GC_EVERY_N_CYCLES = 50
+GC_PROCESSED_THRESHOLD = 100
+
+
+def remaining_interval(start: float, interval: float, clock: Callable[[], float] = time.monotonic) -> float:
+    """Seconds left in an interval that began at start (a clock() value, time.monotonic() by default)."""
+    return max(0.0, interval - (clock() - start))
+
+
+def sleep_for_interval(start: float, interval: float) -> None:
+    """Sleep until interval seconds have passed since start."""
+    time.sleep(remaining_interval(start, interval))
+
+
+def idle_backoff_interval(base_interval: float, max_interval: float, empty_streak: int) -> float:
+    """
+    Interval for the next cycle: base_interval doubled per consecutive empty cycle,
+    capped at max_interval. A streak of 0 returns base_interval unchanged.
+    """
+    if empty_streak <= 0:
+        return base_interval
+    return min(max_interval, base_interval * (2 ** min(empty_streak, MAX_BACKOFF_DOUBLINGS)))
+
+
+def collect_after_cycle(cycle_count: int, processed: int, empty_streak: int = 0) -> None:
+    """
+    Run a full gc pass after heavy cycles and every GC_EVERY_N_CYCLES cycles, so the
+    short-lived dicts/Deals promoted to the oldest generation don't pile up in 24/7 loops.
+    Also runs once per long idle streak (when backoff reaches MAX_BACKOFF_DOUBLINGS) to
+    release whatever the busy cycles left behind.
+    """
+    if (
+        processed > GC_PROCESSED_THRESHOLD
+        or cycle_count % GC_EVERY_N_CYCLES == 0
+        or empty_streak == MAX_BACKOFF_DOUBLINGS
+    ):
+        gc.collect(generation=2)
@@ -0,0 +1,49 @@
+"""
+Token-bucket rate limiting for Airtable (5 requests/sec per base).
+
+Acquire before sending instead of reacting to 429s after the fact.
+"""
+import asyncio
+import threading
+import time
+from functools import lru_cache
+
+AIRTABLE_REQUESTS_PER_SECOND = 5
+
+
+class RateLimiter:
+    """Thread-safe token bucket; acquire() blocks until a token is free."""
+
+    def __init__(self, capacity: int = AIRTABLE_REQUESTS_PER_SECOND, refill_per_sec: float = AIRTABLE_REQUESTS_PER_SECOND):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token (possibly going negative) and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.refill_per_sec)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_per_sec
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+@lru_cache(maxsize=16)
+def get_rate_limiter(base_id: str) -> RateLimiter:
+    """One bucket per base so every table in the base shares the budget."""
+    return RateLimiter()
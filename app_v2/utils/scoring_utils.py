@@ -1,6 +1,12 @@
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+
+import numpy as np
+
 from app_v2 import config
 
+# batch_score strategy indices map into this tuple (same thresholds as score_equity)
+STRATEGIES = ("FLIP", "WHOLESALE", "RENTAL", "TRASH")
+
 
 def compute_mao(arv: float, repairs: float) -> float:
     """
@@ -69,6 +75,47 @@ def score_equity(arv: float, asking: float, repairs: float) -> Tuple[float, str,
     return equity_score, strategy, risk_flags
 
 
+def batch_score(
+    arv: np.ndarray,
+    asking: np.ndarray,
+    repairs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Optional[str]]]:
+    """
+    Vectorized underwriting over aligned float arrays.
+    Same math as compute_mao / compute_spread / compute_spread_ratio / score_equity.
+    Returns: (mao, spread, spread_ratio, equity_score, strategy_idx, risk_flags)
+    where strategy_idx indexes STRATEGIES.
+    """
+    valid = arv > 0
+    mao = arv * config.MAO_MULTIPLIER - repairs
+    spread = arv - asking - repairs
+    spread_ratio = np.divide(spread, arv, out=np.zeros_like(spread), where=valid)
+
+    strategy_idx = np.select(
+        [spread_ratio >= 0.25, spread_ratio >= 0.15, spread_ratio >= 0.05],
+        [0, 1, 2],
+        default=3,
+    )
+    strategy_idx[~valid] = 3
+    equity_score = np.where(valid, np.minimum(100.0, spread_ratio * 200), 0.0)
+
+    flag_masks = (
+        ("LOW_ARV", (arv < 50000).tolist()),
+        ("ASKING_EXCEEDS_ARV", (asking > arv).tolist()),
+        ("HIGH_REPAIR_RATIO", (repairs > arv * 0.5).tolist()),
+        ("NEGATIVE_SPREAD", (spread < 0).tolist()),
+    )
+    risk_flags: List[Optional[str]] = []
+    for i, ok in enumerate(valid.tolist()):
+        if not ok:
+            risk_flags.append("INVALID_ARV")
+            continue
+        flags = [name for name, mask in flag_masks if mask[i]]
+        risk_flags.append(",".join(flags) if flags else None)
+
+    return mao, spread, spread_ratio, equity_score, strategy_idx, risk_flags
+
+
 def compute_buyer_match_score(
     deal_zip: str,
     deal_price: float,
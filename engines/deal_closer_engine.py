@@ -1,9 +1,9 @@
-import json
 import logging
 import threading
 import time
 from typing import Any, Dict, Optional
 
+import orjson
 from sqlalchemy.orm import Session
 
 from app_v2.database import get_session_maker
@@ -48,7 +48,7 @@ def _parse_thread_into_deal(thread: Dict[str, Any]) -> Optional[Deal]:
         asking=asking,
         seller_name=seller_name,
         deadline=deadline,
-        raw_payload=json.dumps(
+        raw_payload=orjson.dumps(
             {
                 "thread_id": thread.get("id"),
                 "subject": thread.get("subject"),
@@ -56,7 +56,7 @@ def _parse_thread_into_deal(thread: Dict[str, Any]) -> Optional[Deal]:
                 "timestamp": thread.get("timestamp").isoformat() if thread.get("timestamp") else None,
                 "preview": text[:2000],
             }
-        ),
+        ).decode("utf-8"),
         status="PENDING",
     )
     return deal
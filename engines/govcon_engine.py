@@ -3,8 +3,7 @@ import time
 from typing import Any, Dict, List
 
 from utils.airtable_utils import read_records
-from utils.airtable_meta import AirtableMetaCache
-from utils.airtable_safe_upsert import AirtableSafeUpsert
+from utils.airtable_safe_upsert import AirtableSafeUpsert, get_safe_upsert
 from utils.codex import Codex
 from utils.discord_utils import post_error
 
@@ -39,13 +38,11 @@ GOVCON_UPDATE_FIELDS = {"Hotness Score"}
 govcon_lock = threading.Lock()
 
 
-def _safe_upsert_govcon(
-    safe: AirtableSafeUpsert,
-    table_id: str,
-    merge_field_id: str,
-    merge_field_name: str,
-    fields: Dict[str, Any],
-) -> None:
+# Five 10-record chunks per flush; AirtableSafeUpsert sends the chunks concurrently
+UPSERT_FLUSH_SIZE = 50
+
+
+def _govcon_update_payload(merge_field_name: str, fields: Dict[str, Any]) -> Dict[str, Any] | None:
     payload = {}
     if merge_field_name in (fields or {}):
         payload[merge_field_name] = fields[merge_field_name]
@@ -57,12 +54,24 @@ def _safe_upsert_govcon(
         }
     )
     if not payload or merge_field_name not in payload:
+        return None
+    return payload
+
+
+def _flush_govcon_updates(
+    safe: AirtableSafeUpsert,
+    table_id: str,
+    merge_field_id: str,
+    buf: List[Dict[str, Any]],
+) -> None:
+    if not buf:
         return
     safe.upsert(
         table_id=table_id,
-        records=[{"fields": payload}],
+        records=[{"fields": payload} for payload in buf],
         merge_field_id=merge_field_id,
     )
+    buf.clear()
 
 
 def run_govcon_engine(payload: Dict[str, Any] | None = None) -> None:
@@ -85,9 +94,9 @@ def run_govcon_engine(payload: Dict[str, Any] | None = None) -> None:
 
         try:
             cx = Codex.load()
-            meta = AirtableMetaCache(cx.AIRTABLE_PAT, cx.AIRTABLE_BASE_ID)
-            safe = AirtableSafeUpsert(cx.AIRTABLE_PAT, cx.AIRTABLE_BASE_ID, meta)
+            safe = get_safe_upsert(cx.AIRTABLE_PAT, cx.AIRTABLE_BASE_ID)
             records = read_records(TABLE_GOVCON)
+            buf: List[Dict[str, Any]] = []
 
             for rec in records:
                 fields = rec.get("fields", {})
@@ -103,13 +112,16 @@ def run_govcon_engine(payload: Dict[str, Any] | None = None) -> None:
 
                 score = min(100.0, total_value / 1000.0)
 
-                _safe_upsert_govcon(
-                    safe,
-                    cx.GOVCON_OPPS_TABLE_ID,
-                    cx.GOVCON_MERGE_FIELD_ID,
+                update = _govcon_update_payload(
                     "Opportunity Name",
                     {"Opportunity Name": name, "Hotness Score": score},
                 )
+                if update:
+                    buf.append(update)
+                if len(buf) >= UPSERT_FLUSH_SIZE:
+                    _flush_govcon_updates(safe, cx.GOVCON_OPPS_TABLE_ID, cx.GOVCON_MERGE_FIELD_ID, buf)
+
+            _flush_govcon_updates(safe, cx.GOVCON_OPPS_TABLE_ID, cx.GOVCON_MERGE_FIELD_ID, buf)
 
         except Exception as e:
             post_error(f"🔴 GovCon Engine Error: {type(e).__name__}: {e}")
@@ -1,9 +1,9 @@
 import threading
-from datetime import datetime
 from typing import Dict, Any
 
-from job_queue import enqueue_sync_airtable
+from job_queue import BufferedSyncWriter
 from utils.airtable_utils import read_records
+from utils.clock import now_iso
 from utils.discord_utils import post_error, post_ops
 
 # Staging tables
@@ -14,6 +14,9 @@ TABLE_INBOUND_GOVCON = "Inbound_GovCon_Raw"
 TABLE_LEADS_REI = "Leads_REI"
 TABLE_GOVCON_OPPORTUNITIES = "GovCon Opportunities"
 
+# Production rows are keyed by the staging External_Id; Airtable dedups on it
+MERGE_FIELDS = ["External_Id"]
+
 ingest_lock = threading.Lock()
 
 
@@ -33,7 +36,10 @@ def _ingest_rei_records() -> Dict[str, int]:
     Returns {"processed": int, "errors": int}
     """
     processed = 0
+    # Records whose writes are buffered; they only count as processed once flushed to the queue
+    buffered = 0
     errors = 0
+    writer = BufferedSyncWriter()
 
     try:
         # Treat both NEW and ERROR as ingestable so we can retry failed records
@@ -76,24 +82,22 @@ def _ingest_rei_records() -> Dict[str, int]:
                 # Default engine state fields
                 lead_fields["Status"] = "NEW"
                 lead_fields["Outbound_Status"] = "NOT_CONTACTED"
-                lead_fields["Ingest_TS"] = datetime.utcnow().isoformat()
+                lead_fields["Ingest_TS"] = now_iso()
 
-                # Write to production table
-                enqueue_sync_airtable(
-                    TABLE_LEADS_REI,
-                    lead_fields,
-                    method="write",
-                )
+                # Write to production table (upsert so re-ingested ERROR rows don't duplicate)
+                if lead_fields["External_Id"]:
+                    writer.add(TABLE_LEADS_REI, lead_fields, method="upsert", merge_fields=MERGE_FIELDS)
+                else:
+                    writer.add(TABLE_LEADS_REI, lead_fields, method="write")
 
                 # Mark staging record as INGESTED (clear old error if any)
-                enqueue_sync_airtable(
+                writer.add(
                     TABLE_INBOUND_REI,
-                    {"Status": "INGESTED", "Error_Message": ""},
+                    {"id": record_id, "fields": {"Status": "INGESTED", "Error_Message": ""}},
                     method="update",
-                    record_id=record_id,
                 )
 
-                processed += 1
+                buffered += 1
 
             except Exception as e:
                 errors += 1
@@ -101,14 +105,13 @@ def _ingest_rei_records() -> Dict[str, int]:
 
                 # Mark staging record as ERROR with message
                 try:
-                    enqueue_sync_airtable(
+                    writer.add(
                         TABLE_INBOUND_REI,
                         {
-                            "Status": "ERROR",
-                            "Error_Message": error_msg[:500],
+                            "id": record_id,
+                            "fields": {"Status": "ERROR", "Error_Message": error_msg[:500]},
                         },
                         method="update",
-                        record_id=record_id,
                     )
                 except Exception:
                     # Best effort; log to Discord at least
@@ -122,6 +125,15 @@ def _ingest_rei_records() -> Dict[str, int]:
         post_error(f"🔴 REI Ingest Fatal Error: {type(e).__name__}: {e}")
         errors += 1
 
+    finally:
+        # Queue whatever is buffered, including ERROR marks, even after a fatal error
+        try:
+            writer.flush()
+            processed = buffered
+        except Exception as e:
+            post_error(f"🔴 REI Ingest Flush Error: {type(e).__name__}: {e}")
+            errors += 1
+
     return {"processed": processed, "errors": errors}
 
 
@@ -132,7 +144,10 @@ def _ingest_govcon_records() -> Dict[str, int]:
     Returns {"processed": int, "errors": int}
     """
     processed = 0
+    # Records whose writes are buffered; they only count as processed once flushed to the queue
+    buffered = 0
     errors = 0
+    writer = BufferedSyncWriter()
 
     try:
         # Also allow retry of ERROR records for GovCon
@@ -171,36 +186,33 @@ def _ingest_govcon_records() -> Dict[str, int]:
                 # Default engine fields on clean table
                 opp_fields["Status"] = "NEW"
 
-                # Write to production table
-                enqueue_sync_airtable(
-                    TABLE_GOVCON_OPPORTUNITIES,
-                    opp_fields,
-                    method="write",
-                )
+                # Write to production table (upsert so re-ingested ERROR rows don't duplicate)
+                if opp_fields.get("External_Id"):
+                    writer.add(TABLE_GOVCON_OPPORTUNITIES, opp_fields, method="upsert", merge_fields=MERGE_FIELDS)
+                else:
+                    writer.add(TABLE_GOVCON_OPPORTUNITIES, opp_fields, method="write")
 
                 # Mark staging record as INGESTED
-                enqueue_sync_airtable(
+                writer.add(
                     TABLE_INBOUND_GOVCON,
-                    {"Status": "INGESTED", "Error_Message": ""},
+                    {"id": record_id, "fields": {"Status": "INGESTED", "Error_Message": ""}},
                     method="update",
-                    record_id=record_id,
                 )
 
-                processed += 1
+                buffered += 1
 
             except Exception as e:
                 errors += 1
                 error_msg = f"{type(e).__name__}: {str(e)}"
 
                 try:
-                    enqueue_sync_airtable(
+                    writer.add(
                         TABLE_INBOUND_GOVCON,
                         {
-                            "Status": "ERROR",
-                            "Error_Message": error_msg[:500],
+                            "id": record_id,
+                            "fields": {"Status": "ERROR", "Error_Message": error_msg[:500]},
                         },
                         method="update",
-                        record_id=record_id,
                     )
                 except Exception:
                     pass
@@ -213,6 +225,15 @@ def _ingest_govcon_records() -> Dict[str, int]:
         post_error(f"🔴 GovCon Ingest Fatal Error: {type(e).__name__}: {e}")
         errors += 1
 
+    finally:
+        # Queue whatever is buffered, including ERROR marks, even after a fatal error
+        try:
+            writer.flush()
+            processed = buffered
+        except Exception as e:
+            post_error(f"🔴 GovCon Ingest Flush Error: {type(e).__name__}: {e}")
+            errors += 1
+
     return {"processed": processed, "errors": errors}
 
 
@@ -3,7 +3,8 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 
-from utils.airtable_utils import read_records, write_record
+from utils.airtable_utils import first_record, match_formula, read_records, write_record
+from utils.clock import now_iso
 from utils.twilio_utils import send_sms
 from utils.discord_utils import post_error, post_ops
 
@@ -47,21 +48,19 @@ def _get_last_touch_timestamp(phone_number: str) -> Optional[datetime]:
     Returns datetime or None if never contacted.
     """
     try:
-        # Filter by phone number, sort by timestamp descending
-        formula = f"{{phone_number}}='{phone_number}'"
-        records = read_records(TABLE_OUTBOUND_LOG, filter_formula=formula)
-        if not records:
+        # Filter by phone number, sort by timestamp descending; only the newest row is needed
+        formula = match_formula(("phone_number",), (phone_number,))
+        latest = first_record(TABLE_OUTBOUND_LOG, filter_formula=formula, sort=[("timestamp", "desc")])
+        if not latest:
             return None
         # Assume "timestamp" field is ISO8601 string
-        timestamps = []
-        for rec in records:
-            ts_str = rec.get("fields", {}).get("timestamp")
-            if ts_str:
-                try:
-                    timestamps.append(datetime.fromisoformat(ts_str.replace("Z", "+00:00")))
-                except ValueError:
-                    continue
-        return max(timestamps) if timestamps else None
+        ts_str = latest.get("fields", {}).get("timestamp")
+        if not ts_str:
+            return None
+        try:
+            return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+        except ValueError:
+            return None
     except Exception as e:
         post_error(f"🚨 Outbound: failed to query last touch for {phone_number}: {e}")
         return None
@@ -74,7 +73,7 @@ def _count_touches_last_7_days(phone_number: str) -> int:
     try:
         cutoff = datetime.utcnow() - timedelta(days=7)
         cutoff_iso = cutoff.isoformat()
-        formula = f"AND({{phone_number}}='{phone_number}', IS_AFTER({{timestamp}}, '{cutoff_iso}'))"
+        formula = f"AND({match_formula(('phone_number',), (phone_number,))}, IS_AFTER({{timestamp}}, '{cutoff_iso}'))"
         records = read_records(TABLE_OUTBOUND_LOG, filter_formula=formula)
         return len(records)
     except Exception as e:
@@ -111,7 +110,7 @@ def _log_outbound_send(phone_number: str, bucket: str, message: str, success: bo
             "bucket": bucket,
             "message": message[:500],  # Truncate long messages
             "success": success,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(with_millis=True),
         }
         if error_msg:
             fields["error"] = error_msg[:500]
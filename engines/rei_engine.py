@@ -1,10 +1,11 @@
 import threading
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
-from utils.airtable_utils import read_records
-from utils.airtable_meta import AirtableMetaCache
-from utils.airtable_safe_upsert import AirtableSafeUpsert
+import numpy as np
+
+from utils.airtable_utils import iter_record_pages
+from utils.airtable_safe_upsert import AirtableSafeUpsert, get_safe_upsert
 from utils.codex import Codex
 from utils.discord_utils import post_error, post_ops
 
@@ -36,16 +37,13 @@ LEADS_REI_FIELDS: List[str] = [
 # Only this field is updated by the engine (it exists in Airtable)
 LEADS_REI_UPDATE_FIELDS = {"Price_Sanity_Flag"}
 
+# 5%+ spread is "sane"
+SANE_SPREAD_RATIO = 0.05
+
 rei_lock = threading.Lock()
 
 
-def _safe_upsert_lead(
-    safe: AirtableSafeUpsert,
-    table_id: str,
-    merge_field_id: str,
-    merge_field_name: str,
-    fields: Dict[str, Any],
-) -> None:
+def _lead_update_payload(merge_field_name: str, fields: Dict[str, Any]) -> Dict[str, Any] | None:
     payload = {}
     if merge_field_name in (fields or {}):
         payload[merge_field_name] = fields[merge_field_name]
@@ -57,23 +55,71 @@ def _safe_upsert_lead(
         }
     )
     if not payload or merge_field_name not in payload:
-        return
+        return None
+    return payload
 
+
+def _flush_lead_updates(
+    safe: AirtableSafeUpsert,
+    table_id: str,
+    merge_field_id: str,
+    buf: List[Dict[str, Any]],
+) -> None:
+    if not buf:
+        return
     try:
         safe.upsert(
             table_id=table_id,
-            records=[{"fields": payload}],
+            records=[{"fields": payload} for payload in buf],
             merge_field_id=merge_field_id,
         )
     except Exception as e:
         post_error(f"🔴 REI Engine Update Error: {type(e).__name__}: {e}")
+    finally:
+        buf.clear()
+
+
+def _spread_ratios(records: List[Dict[str, Any]]) -> Tuple[List[Tuple[Any, Dict[str, Any]]], np.ndarray]:
+    """
+    Keep leads with a key and a positive ARV/Ask pair, and compute
+    (ARV - Ask) / ARV for all of them in one vectorized pass.
+    Returns ([(key, fields), ...], ratios) aligned by index.
+    """
+    kept: List[Tuple[Any, Dict[str, Any]]] = []
+    arvs: List[float] = []
+    asks: List[float] = []
+    for rec in records:
+        fields = rec.get("fields") or {}
+        merge_value = fields.get("key")
+        if not merge_value:
+            continue
+
+        if "ARV" not in fields or "Ask" not in fields:
+            continue
+
+        try:
+            arv = float(fields.get("ARV") or 0)
+            ask = float(fields.get("Ask") or 0)
+        except (TypeError, ValueError):
+            continue
+
+        if arv <= 0:
+            continue
+
+        kept.append((merge_value, fields))
+        arvs.append(arv)
+        asks.append(ask)
+
+    arv_arr = np.fromiter(arvs, dtype=np.float64, count=len(arvs))
+    ask_arr = np.fromiter(asks, dtype=np.float64, count=len(asks))
+    return kept, (arv_arr - ask_arr) / arv_arr
 
 
 def run_rei_engine(payload: Dict[str, Any] | None = None) -> None:
     """
     REI sanity / ranking engine.
 
-    - Reads all records from Leads_REI.
+    - Streams Leads_REI page by page.
     - Computes spread_ratio = (ARV - Ask) / ARV when ARV > 0.
     - Sets Price_Sanity_Flag = True if spread_ratio >= 5%.
     - Sends top 3 by spread_ratio to Discord.
@@ -91,47 +137,27 @@ def run_rei_engine(payload: Dict[str, Any] | None = None) -> None:
 
         try:
             cx = Codex.load()
-            meta = AirtableMetaCache(cx.AIRTABLE_PAT, cx.AIRTABLE_BASE_ID)
-            safe = AirtableSafeUpsert(cx.AIRTABLE_PAT, cx.AIRTABLE_BASE_ID, meta)
-            records = read_records(TABLE_REI)
-            if not isinstance(records, list):
-                records = []
-            ranked = []
-
-            for rec in records:
-                fields = rec.get("fields") or {}
-                merge_value = fields.get("key")
-                if not merge_value:
-                    continue
-
-                if "ARV" not in fields or "Ask" not in fields:
-                    continue
-
-                try:
-                    arv = float(fields.get("ARV") or 0)
-                    ask = float(fields.get("Ask") or 0)
-                except (TypeError, ValueError):
-                    continue
-
-                if arv <= 0:
-                    continue
-
-                spread = arv - ask
-                spread_ratio = spread / arv
-
-                sane = spread_ratio >= 0.05  # 5%+ spread is "sane"
-                _safe_upsert_lead(
-                    safe,
-                    cx.LEADS_REI_TABLE_ID,
-                    cx.REI_MERGE_FIELD_ID,
-                    "key",
-                    {"key": merge_value, "Price_Sanity_Flag": sane},
-                )
-
-                ranked.append((spread_ratio, fields))
-
-            ranked.sort(key=lambda x: x[0], reverse=True)
-            top = ranked[:3]
+            safe = get_safe_upsert(cx.AIRTABLE_PAT, cx.AIRTABLE_BASE_ID)
+            top: List[Tuple[float, Dict[str, Any]]] = []
+            buf: List[Dict[str, Any]] = []
+
+            # One Airtable page at a time: score, flush its updates, keep only a running top 3
+            for page in iter_record_pages(TABLE_REI):
+                candidates, ratios = _spread_ratios(page)
+                sane_mask = ratios >= SANE_SPREAD_RATIO
+
+                for (merge_value, _fields), sane in zip(candidates, sane_mask.tolist()):
+                    update = _lead_update_payload("key", {"key": merge_value, "Price_Sanity_Flag": sane})
+                    if update:
+                        buf.append(update)
+
+                _flush_lead_updates(safe, cx.LEADS_REI_TABLE_ID, cx.REI_MERGE_FIELD_ID, buf)
+
+                # Stable descending order keeps ties in read order, like sort(reverse=True)
+                for i in np.argsort(-ratios, kind="stable")[:3]:
+                    top.append((float(ratios[i]), candidates[i][1]))
+                top.sort(key=lambda x: x[0], reverse=True)
+                del top[3:]
 
             if top:
                 lines = []
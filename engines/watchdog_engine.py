@@ -5,10 +5,13 @@ from utils.discord_utils import post_error
 
 watchdog_lock = threading.Lock()
 
+# Probe the local server over one kept-alive connection instead of reconnecting every 30s
+_SESSION = requests.Session()
+
 def run_watchdog_loop():
     while True:
         try:
-            r = requests.get("http://127.0.0.1:8080/health", timeout=4)
+            r = _SESSION.get("http://127.0.0.1:8080/health", timeout=4)
             if r.status_code != 200:
                 post_error("⚠️ Watchdog: healthcheck failed")
         except:
@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app_v2.database import get_session_maker
 from app_v2.models.job import Job
+from utils.airtable_utils import MAX_RECORDS_PER_REQUEST
 
 SessionLocal = get_session_maker()
 
+# Postgres channel the worker LISTENs on; notified on every enqueue
+JOB_NOTIFY_CHANNEL = "krizzy_jobs"
+
 
 def enqueue_job(
     job_type: str,
@@ -35,6 +40,9 @@ def enqueue_job(
         )
 
         session.add(job)
+        if session.get_bind().dialect.name == "postgresql":
+            # Delivered on commit, so the worker only wakes once the row is visible
+            session.execute(text("SELECT pg_notify(:channel, '')"), {"channel": JOB_NOTIFY_CHANNEL})
         session.commit()
         session.refresh(job)
         return job
@@ -49,10 +57,11 @@ def enqueue_sync_airtable(
     *,
     method: str,
     record_id: Optional[str] = None,
+    merge_fields: Optional[List[str]] = None,
     run_at: Optional[datetime] = None,
     db: Optional[Session] = None,
 ) -> Job:
-    """Schedule an Airtable sync job (write/update).
+    """Schedule an Airtable sync job (write/update/upsert).
 
     This avoids blocking ingestion/scoring paths on network calls.
     """
@@ -65,10 +74,73 @@ def enqueue_sync_airtable(
 
     if record_id:
         payload["record_id"] = record_id
+    if merge_fields:
+        payload["merge_fields"] = list(merge_fields)
 
     return enqueue_job("sync_airtable", payload=payload, run_at=run_at, db=db)
 
 
+def enqueue_sync_airtable_batch(
+    table: str,
+    records: List[Dict[str, Any]],
+    *,
+    method: str,
+    merge_fields: Optional[List[str]] = None,
+    db: Optional[Session] = None,
+) -> Job:
+    """Schedule one Airtable sync job carrying up to 10 records.
+
+    For method="update" each record is {"id": ..., "fields": {...}};
+    for write/upsert each record is a plain fields dict.
+    """
+
+    payload: Dict[str, Any] = {
+        "method": method,
+        "table": table,
+        "records": records,
+    }
+    if merge_fields:
+        payload["merge_fields"] = list(merge_fields)
+
+    return enqueue_job("sync_airtable", payload=payload, db=db)
+
+
+class BufferedSyncWriter:
+    """Coalesce per-record Airtable syncs into one queued job per 10 records.
+
+    Callers add() records as they go and must flush() when done.
+    """
+
+    def __init__(self, batch_size: int = MAX_RECORDS_PER_REQUEST):
+        self.batch_size = batch_size
+        self._buffers: Dict[Tuple[str, str, Tuple[str, ...]], List[Dict[str, Any]]] = {}
+
+    def add(
+        self,
+        table: str,
+        record: Dict[str, Any],
+        *,
+        method: str,
+        merge_fields: Optional[List[str]] = None,
+    ) -> None:
+        key = (table, method, tuple(merge_fields or ()))
+        buf = self._buffers.setdefault(key, [])
+        buf.append(record)
+        if len(buf) >= self.batch_size:
+            self._flush_key(key)
+
+    def _flush_key(self, key: Tuple[str, str, Tuple[str, ...]]) -> None:
+        buf = self._buffers.pop(key, None)
+        if not buf:
+            return
+        table, method, merge_fields = key
+        enqueue_sync_airtable_batch(table, buf, method=method, merge_fields=list(merge_fields) or None)
+
+    def flush(self) -> None:
+        for key in list(self._buffers):
+            self._flush_key(key)
+
+
 def enqueue_engine_run(engine: str, payload: Optional[Dict[str, Any]] = None, db: Optional[Session] = None) -> Job:
     """Helper for queuing engine execution jobs."""
 
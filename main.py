@@ -1,14 +1,18 @@
+import hmac
 import logging
 import os
+import random
 import threading
 import time
 from typing import Any, Dict
 
-from fastapi import FastAPI, Header, HTTPException
+import orjson
+from fastapi import FastAPI, Header, HTTPException, Response
 
+from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
-from utils.airtable_meta import AirtableMetaCache
+from utils.airtable_meta import get_meta_cache
 from utils.codex import Codex, CodexError
 from utils.db import db_ping, get_engine
 from utils.models import Base as OpsBase
@@ -20,6 +24,7 @@ app = FastAPI()
 
 # Router wiring
 from app_v2.llm_control.command_bus import router as command_bus_router
+from app_v2.llm_control.command_bus import warm_up as warm_command_bus
 from app_v2.routes_feeds import router as feeds_router
 from job_queue import enqueue_engine_run
 
@@ -27,24 +32,48 @@ app.include_router(command_bus_router)
 app.include_router(feeds_router)
 
 
-@app.get("/")
-def root():
-    """Default landing endpoint for uptime and platform probes."""
-    return {
+# Static bodies for probe endpoints, serialized once at import
+_ROOT_BODY = orjson.dumps(
+    {
         "message": "Krizzy Ops Launch API",
         "health_endpoint": "/health",
         "docs": "/docs",
     }
+)
+_FAVICON_BODY = orjson.dumps({"status": "ok"})
+
+
+@app.get("/")
+async def root():
+    """Default landing endpoint for uptime and platform probes."""
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/favicon.ico")
-def favicon():
+async def favicon():
     """Return an empty response for browsers requesting a favicon."""
-    return {"status": "ok"}
+    return Response(content=_FAVICON_BODY, media_type="application/json")
 
 
 DAEMONS_STARTED = False
 
+# Read once; startup and /health both consult it
+WORKER_ENABLED = os.getenv("WORKER_ENABLED", "true").lower() == "true"
+
+
+def _health_body() -> bytes:
+    return orjson.dumps(
+        {
+            "status": "ok",
+            "daemons_started": DAEMONS_STARTED,
+            "worker_enabled": WORKER_ENABLED,
+        }
+    )
+
+
+# Rebuilt only when DAEMONS_STARTED changes (at startup); /health just returns it
+_HEALTH_BODY = _health_body()
+
 
 @app.on_event("startup")
 def startup_event():
@@ -53,14 +82,14 @@ def startup_event():
     Starts autonomous worker loop if enabled.
     NOTE: DB tables are NOT created here - use /admin/init endpoint instead.
     """
-    global DAEMONS_STARTED
+    global DAEMONS_STARTED, _HEALTH_BODY
 
-    # Only start worker if enabled
-    worker_enabled = os.getenv("WORKER_ENABLED", "true").lower() == "true"
+    logger.info("Boot sequence starting", extra={"worker_enabled": WORKER_ENABLED})
 
-    logger.info("Boot sequence starting", extra={"worker_enabled": worker_enabled})
+    # Load the command bus's deferred engine imports off the request path
+    threading.Thread(target=warm_command_bus, name="command-bus-warm-up", daemon=True).start()
 
-    if worker_enabled:
+    if WORKER_ENABLED:
         try:
             # Lazy import to avoid eager DB connection
             from app_v2.agent.v2_llm_worker import run_worker_loop
@@ -80,23 +109,38 @@ def startup_event():
         DAEMONS_STARTED = False
         logger.info("Worker disabled via WORKER_ENABLED flag")
 
+    _HEALTH_BODY = _health_body()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    """Stop the worker loop so the process exits without waiting out its interval."""
+    if DAEMONS_STARTED:
+        from app_v2.agent.v2_llm_worker import stop_worker_loop
+
+        stop_worker_loop()
+
 
 @app.get("/health")
-def health():
+async def health():
     """Health check endpoint."""
-    worker_enabled = os.getenv("WORKER_ENABLED", "true").lower() == "true"
-
-    if worker_enabled and not DAEMONS_STARTED:
+    if WORKER_ENABLED and not DAEMONS_STARTED:
         raise HTTPException(
             status_code=500,
             detail="Execution kernel not running"
         )
 
-    return {
-        "status": "ok",
-        "daemons_started": DAEMONS_STARTED,
-        "worker_enabled": worker_enabled
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+# Read once at import; admin requests compare against it without touching the environment
+_EXPECTED_INIT_KEY = os.getenv("INIT_KEY", "").strip().encode("utf-8")
+
+
+def require_init_key(key: str) -> None:
+    """Reject the request unless key matches INIT_KEY (constant-time compare)."""
+    if not _EXPECTED_INIT_KEY or not hmac.compare_digest((key or "").encode("utf-8"), _EXPECTED_INIT_KEY):
+        raise HTTPException(status_code=401, detail="bad init key")
 
 
 @app.post("/admin/init")
@@ -104,29 +148,38 @@ def admin_init(x_init_key: str = Header(default="")):
     """
     Initialize database tables on demand.
     Protected by INIT_KEY environment variable.
-    Retries up to 5 times with exponential backoff for sleeping Postgres.
+    Probes connectivity up to 5 times (exponential backoff + jitter) for sleeping
+    Postgres, then creates tables once.
     """
+    require_init_key(x_init_key)
     cx = Codex.load()
-    if x_init_key != cx.INIT_KEY:
-        raise HTTPException(status_code=401, detail="bad init key")
 
     # Lazy import to avoid touching DB until explicitly requested
     from app_v2.database import Base
     import app_v2.models  # noqa: F401  # Ensure all models are registered with metadata
 
-    # Retry because Railway Postgres may still be waking up
+    # Cheap connectivity probe first: Railway Postgres may still be waking up,
+    # and there's no point running DDL introspection until it answers
+    engine = get_engine(cx.DATABASE_URL)
     last_err = None
     for attempt in range(1, 6):
         try:
-            engine = get_engine(cx.DATABASE_URL)
-            Base.metadata.create_all(bind=engine)
-            OpsBase.metadata.create_all(bind=engine)
-            return {"status": "ok", "attempt": attempt}
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            break
         except OperationalError as e:
             last_err = str(e)
-            time.sleep(2 * attempt)
+            if attempt < 5:
+                time.sleep(min(8, 2 ** (attempt - 1)) + random.random())
+    else:
+        raise HTTPException(status_code=503, detail=f"DB init failed after retries: {last_err}")
 
-    raise HTTPException(status_code=503, detail=f"DB init failed after retries: {last_err}")
+    try:
+        Base.metadata.create_all(bind=engine)
+        OpsBase.metadata.create_all(bind=engine)
+    except OperationalError as e:
+        raise HTTPException(status_code=503, detail=f"DB init failed: {e}")
+    return {"status": "ok", "attempt": attempt}
 
 
 @app.get("/codex/check")
@@ -141,7 +194,7 @@ def codex_check():
         return {"ok": False, "error": "DB_PING_FAIL", "detail": db}
 
     # Airtable meta existence check (no table writes)
-    meta = AirtableMetaCache(cx.AIRTABLE_PAT, cx.AIRTABLE_BASE_ID)
+    meta = get_meta_cache(cx.AIRTABLE_PAT, cx.AIRTABLE_BASE_ID)
     data = meta.fetch()
     return {"ok": True, "tables": len(data.get("tables", []))}
 
@@ -1,7 +1,10 @@
 import time
-import requests
+from functools import lru_cache
 from typing import Dict, Any
 
+from app_v2.utils.rate_limit import get_rate_limiter
+from utils.airtable_utils import SESSION
+
 
 class AirtableMetaCache:
     def __init__(self, pat: str, base_id: str, ttl_seconds: int = 900):
@@ -10,6 +13,7 @@ class AirtableMetaCache:
         self.ttl = ttl_seconds
         self._cache = None
         self._ts = 0
+        self._tables: Dict[str, Dict[str, str]] = {}
 
     def _headers(self):
         return {"Authorization": f"Bearer {self.pat}"}
@@ -20,22 +24,36 @@ class AirtableMetaCache:
             return self._cache
 
         url = f"https://api.airtable.com/v0/meta/bases/{self.base_id}/tables"
-        r = requests.get(url, headers=self._headers(), timeout=20)
+        get_rate_limiter(self.base_id).acquire()
+        r = SESSION.get(url, headers=self._headers(), timeout=20)
         r.raise_for_status()
         data = r.json()
         self._cache = data
         self._ts = now
+        self._tables = {}
         return data
 
     def invalidate(self):
         self._cache = None
         self._ts = 0
+        self._tables = {}
 
     def table_field_allowlist(self, table_id: str) -> Dict[str, str]:
         """Returns {field_name: field_id} for the table."""
         data = self.fetch()
+        cached = self._tables.get(table_id)
+        if cached is not None:
+            return cached
         for t in data.get("tables", []):
             if t.get("id") == table_id:
                 fields = t.get("fields", [])
-                return {f["name"]: f["id"] for f in fields}
+                allow = {f["name"]: f["id"] for f in fields}
+                self._tables[table_id] = allow
+                return allow
         raise ValueError(f"Table not found in Airtable meta schema: {table_id}")
+
+
+@lru_cache(maxsize=8)
+def get_meta_cache(pat: str, base_id: str) -> AirtableMetaCache:
+    """Process-wide meta cache per (pat, base) so the TTL survives engine cycles."""
+    return AirtableMetaCache(pat, base_id)
@@ -1,6 +1,25 @@
-import requests
+import asyncio
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
-from utils.airtable_meta import AirtableMetaCache
+
+import aiohttp
+
+from app_v2.utils.http_errors import to_requests_error
+from app_v2.utils.rate_limit import get_rate_limiter
+from utils.airtable_meta import AirtableMetaCache, get_meta_cache
+from utils.airtable_utils import MAX_RECORDS_PER_REQUEST, SESSION, invalidate_read_cache
+
+
+# Airtable allows 5 requests/sec per base; never have more than that in flight
+MAX_CONCURRENT_REQUESTS = 5
+
+
+def _loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
 
 
 class AirtableSafeUpsert:
@@ -35,14 +54,88 @@ class AirtableSafeUpsert:
         """
         Uses Airtable upsert with fieldIdsToMergeOn (requires field ID).
         We write with FIELD NAMES (not IDs) but intersect to avoid 422.
+        Records are sent in chunks of MAX_RECORDS_PER_REQUEST (Airtable's limit).
         """
+        chunks = [
+            records[i : i + MAX_RECORDS_PER_REQUEST]
+            for i in range(0, len(records), MAX_RECORDS_PER_REQUEST)
+        ]
+        try:
+            if len(chunks) > 1 and not _loop_running():
+                # Overlap request latency; asyncio.run can't nest inside a running loop.
+                # Warm the allowlist first so the coroutines don't block on the meta fetch.
+                self.meta.table_field_allowlist(table_id)
+                try:
+                    results = asyncio.run(self._aupsert_chunks(table_id, chunks, merge_field_id))
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    # Same exception types as the sync path
+                    raise to_requests_error(e) from e
+            else:
+                results = [self._upsert_chunk(table_id, chunk, merge_field_id) for chunk in chunks]
+        finally:
+            # Even a failed upsert may have written some chunks. Only cached reads keyed by
+            # this table ID are dropped; a reader that caches by table name and writes here
+            # must not use use_cache=True.
+            invalidate_read_cache(table_id)
+
+        saved: List[Dict[str, Any]] = []
+        dropped_all: List[Dict[str, Any]] = []
+        for result in results:
+            dropped_all.extend(result.get("dropped", []))
+            if not result["ok"]:
+                result["dropped"] = dropped_all
+                return result
+            saved.extend(result["data"].get("records", []))
+        return {"ok": True, "data": {"records": saved}, "dropped": dropped_all}
+
+    async def _aupsert_chunks(
+        self,
+        table_id: str,
+        chunks: List[List[Dict[str, Any]]],
+        merge_field_id: str,
+    ) -> List[Dict[str, Any]]:
+        sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_REQUESTS, keepalive_timeout=60)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self._headers()) as session:
+            return await asyncio.gather(
+                *(self._aupsert_chunk(session, sem, table_id, chunk, merge_field_id) for chunk in chunks)
+            )
+
+    async def _aupsert_chunk(
+        self,
+        session: aiohttp.ClientSession,
+        sem: asyncio.Semaphore,
+        table_id: str,
+        records: List[Dict[str, Any]],
+        merge_field_id: str,
+    ) -> Dict[str, Any]:
         url = f"https://api.airtable.com/v0/{self.base_id}/{table_id}"
+        payload, dropped_all = self._upsert_payload(table_id, records, merge_field_id)
+        async with sem:
+            await get_rate_limiter(self.base_id).acquire_async()
+            async with session.patch(url, json=payload) as r:
+                schema_drift = r.status == 422
+                if not schema_drift:
+                    r.raise_for_status()
+                    data = await r.json()
+        if schema_drift:
+            # Refresh meta and send only the refiltered retry (not the stale payload again)
+            return await asyncio.to_thread(
+                self._retry_after_schema_refresh, table_id, records, merge_field_id, dropped_all
+            )
+        return {"ok": True, "data": data, "dropped": dropped_all}
+
+    def _upsert_payload(
+        self,
+        table_id: str,
+        records: List[Dict[str, Any]],
+        merge_field_id: str,
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         safe_records = []
         dropped_all = []
-
         for rec in records:
-            fields = rec.get("fields", {})
-            safe_fields, dropped = self._intersect_fields(table_id, fields)
+            safe_fields, dropped = self._intersect_fields(table_id, rec.get("fields", {}))
             dropped_all.append({"dropped": dropped})
             safe_records.append({"fields": safe_fields})
 
@@ -52,27 +145,52 @@ class AirtableSafeUpsert:
                 "fieldsToMergeOn": [merge_field_id]  # Airtable expects field IDs here
             },
         }
+        return payload, dropped_all
 
-        r = requests.patch(url, headers=self._headers(), json=payload, timeout=30)
+    def _retry_after_schema_refresh(
+        self,
+        table_id: str,
+        records: List[Dict[str, Any]],
+        merge_field_id: str,
+        dropped_all: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """After a 422: refresh the allowlist, refilter and send once more."""
+        url = f"https://api.airtable.com/v0/{self.base_id}/{table_id}"
+        self.meta.invalidate()
+        payload, _ = self._upsert_payload(table_id, records, merge_field_id)
+        get_rate_limiter(self.base_id).acquire()
+        r = SESSION.patch(url, headers=self._headers(), json=payload, timeout=30)
+        if r.status_code == 422:
+            return {
+                "ok": False,
+                "error": "AIRTABLE_422_SCHEMA_GUARD_FAIL",
+                "status": r.status_code,
+                "body": r.text[:2000],
+                "dropped": dropped_all,
+            }
+        r.raise_for_status()
+        return {"ok": True, "data": r.json(), "dropped": dropped_all}
+
+    def _upsert_chunk(
+        self,
+        table_id: str,
+        records: List[Dict[str, Any]],
+        merge_field_id: str,
+    ) -> Dict[str, Any]:
+        url = f"https://api.airtable.com/v0/{self.base_id}/{table_id}"
+        payload, dropped_all = self._upsert_payload(table_id, records, merge_field_id)
+
+        get_rate_limiter(self.base_id).acquire()
+        r = SESSION.patch(url, headers=self._headers(), json=payload, timeout=30)
         if r.status_code == 422:
             # Schema drift: refresh and retry once
-            self.meta.invalidate()
-            allow_retry = []
-            for rec in records:
-                safe_fields, _ = self._intersect_fields(table_id, rec.get("fields", {}))
-                allow_retry.append({"fields": safe_fields})
-            payload["records"] = allow_retry
-            r2 = requests.patch(url, headers=self._headers(), json=payload, timeout=30)
-            if r2.status_code == 422:
-                return {
-                    "ok": False,
-                    "error": "AIRTABLE_422_SCHEMA_GUARD_FAIL",
-                    "status": r2.status_code,
-                    "body": r2.text[:2000],
-                    "dropped": dropped_all,
-                }
-            r2.raise_for_status()
-            return {"ok": True, "data": r2.json(), "dropped": dropped_all}
+            return self._retry_after_schema_refresh(table_id, records, merge_field_id, dropped_all)
 
         r.raise_for_status()
         return {"ok": True, "data": r.json(), "dropped": dropped_all}
+
+
+@lru_cache(maxsize=8)
+def get_safe_upsert(pat: str, base_id: str) -> AirtableSafeUpsert:
+    """Shared upserter bound to the shared meta cache for this base."""
+    return AirtableSafeUpsert(pat, base_id, get_meta_cache(pat, base_id))
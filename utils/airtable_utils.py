@@ -1,18 +1,71 @@
 import os
+import threading
+import time
+from functools import lru_cache
+
+import orjson
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 
+from app_v2.utils.rate_limit import get_rate_limiter
 from utils.discord_utils import post_error
 
 BASE_ID = os.getenv("AIRTABLE_BASE_ID", "")
 API_KEY = os.getenv("AIRTABLE_API_KEY", "")
 API = "https://api.airtable.com/v0"
 
+# Airtable rejects create/update/upsert bodies with more than 10 records
+MAX_RECORDS_PER_REQUEST = 10
+
 HEADERS = {
     "Authorization": f"Bearer {API_KEY}",
     "Content-Type": "application/json"
 }
 
+# One keep-alive pool for every Airtable call so we only pay the TLS handshake once
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
+# Shared 5 req/s bucket for this base; acquired before every request
+_RATE = get_rate_limiter(BASE_ID)
+
+# Short-lived cache for idempotent reads: (table, query params) -> (fetched_at, pages)
+READ_CACHE_TTL_SECONDS = 60
+# Oldest entries are evicted past this many distinct reads
+READ_CACHE_MAX_ENTRIES = 128
+_read_cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[float, List[List[Dict[str, Any]]]]] = {}
+_read_cache_lock = threading.Lock()
+
+
+# Backslash first so the escapes added for quotes aren't doubled
+_FORMULA_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", "'": "\\'"})
+
+
+def escape_formula_value(value: Any) -> str:
+    """Escape a value for use inside a single-quoted Airtable formula string."""
+    return str(value).translate(_FORMULA_ESCAPE_TABLE)
+
+
+@lru_cache(maxsize=128)
+def _formula_template(keys: Tuple[str, ...]) -> str:
+    clauses = [f"{{{{{key}}}}}='{{{i}}}'" for i, key in enumerate(keys)]
+    if len(clauses) == 1:
+        return clauses[0]
+    return "AND(" + ", ".join(clauses) + ")"
+
+
+def match_formula(keys: Tuple[str, ...], values: Tuple[Any, ...]) -> str:
+    """filterByFormula matching every key to its value, e.g. AND({a}='1', {b}='2')."""
+    return _formula_template(keys).format(*map(escape_formula_value, values))
+
+
+def invalidate_read_cache(table: str) -> None:
+    """Drop every cached read for a table; called after writes to it."""
+    with _read_cache_lock:
+        for key in [k for k in _read_cache if k[0] == table]:
+            _read_cache.pop(key, None)
+
 
 def _log_airtable_error(
     method: str,
@@ -38,29 +91,164 @@ def _log_airtable_error(
     post_error("\n".join(parts))
 
 
-def read_records(table: str, formula: Optional[str] = None, filter_formula: Optional[str] = None) -> List[Dict[str, Any]]:
+def _send(
+    method: str,
+    table: str,
+    url: str,
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    json: Optional[Dict[str, Any]] = None,
+    record_id: Optional[str] = None,
+    field_keys: Optional[List[str]] = None,
+    label: Optional[str] = None,
+) -> Dict[str, Any]:
     """
-    Read records from Airtable table with optional filterByFormula.
-    Logs errors and re-raises on failure.
+    Single request path for every Airtable call in this module:
+    rate limit, pooled session, structured error logging, read-cache invalidation.
     """
-    url = f"{API}/{BASE_ID}/{table}"
-    params = {}
-    if filter_formula:
-        params["filterByFormula"] = filter_formula
-    elif formula:
-        params["filterByFormula"] = formula
-
+    label = label or method
     try:
-        r = requests.get(url, headers=HEADERS, params=params, timeout=10)
-        if not r.ok:
-            _log_airtable_error("GET", table, None, r.status_code, r.text)
-            r.raise_for_status()
-        return r.json().get("records", [])
+        _RATE.acquire()
+        # Pre-serialize with orjson; HEADERS already carries the JSON content type
+        body = orjson.dumps(json) if json is not None else None
+        r = SESSION.request(method, url, headers=HEADERS, params=params, data=body, timeout=10)
     except requests.exceptions.RequestException as e:
         # Network/timeout errors
-        post_error(f"🚨 Airtable GET network error on table `{table}`: {e}")
+        parts = [f"🚨 Airtable {label} network error on table `{table}`"]
+        if record_id:
+            parts.append(f"record `{record_id}`")
+        if field_keys:
+            parts.append(f"fields `{', '.join(field_keys)}`")
+        post_error(", ".join(parts) + f": {e}")
         raise
 
+    if not r.ok:
+        _log_airtable_error(label, table, record_id, r.status_code, r.text, field_keys)
+        r.raise_for_status()
+    if method != "GET":
+        invalidate_read_cache(table)
+    return r.json()
+
+
+def _read_params(
+    filter_formula: Optional[str],
+    max_records: Optional[int],
+    sort: Optional[List[Tuple[str, str]]],
+    page_size: Optional[int],
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {}
+    if filter_formula:
+        params["filterByFormula"] = filter_formula
+    if max_records:
+        params["maxRecords"] = max_records
+    if page_size:
+        params["pageSize"] = page_size
+    for i, (field, direction) in enumerate(sort or []):
+        params[f"sort[{i}][field]"] = field
+        params[f"sort[{i}][direction]"] = direction
+    return params
+
+
+def iter_record_pages(
+    table: str,
+    filter_formula: Optional[str] = None,
+    max_records: Optional[int] = None,
+    sort: Optional[List[Tuple[str, str]]] = None,
+    page_size: int = 100,
+    use_cache: bool = False,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield one page (<= page_size records) at a time, following Airtable's offset cursor.
+    Peak memory is one page unless use_cache=True, which reads every page first,
+    caches them for READ_CACHE_TTL_SECONDS and then yields from the cached list.
+    Logs errors and re-raises on failure.
+    """
+    url = f"{API}/{BASE_ID}/{table}"
+    params = _read_params(filter_formula, max_records, sort, page_size)
+
+    cache_key = (table, tuple(sorted(params.items())))
+    if use_cache:
+        with _read_cache_lock:
+            cached = _read_cache.get(cache_key)
+        if cached and (time.time() - cached[0]) < READ_CACHE_TTL_SECONDS:
+            yield from cached[1]
+            return
+
+    if use_cache:
+        # Store before yielding: a write made while the caller is still iterating
+        # invalidates this entry instead of being overwritten by stale pages later.
+        pages = list(_fetch_pages(table, url, params))
+        with _read_cache_lock:
+            _read_cache.pop(cache_key, None)
+            while len(_read_cache) >= READ_CACHE_MAX_ENTRIES:
+                _read_cache.pop(next(iter(_read_cache)))
+            _read_cache[cache_key] = (time.time(), pages)
+        yield from pages
+        return
+
+    yield from _fetch_pages(table, url, params)
+
+
+def _fetch_pages(table: str, url: str, params: Dict[str, Any]) -> Iterator[List[Dict[str, Any]]]:
+    while True:
+        data = _send("GET", table, url, params=params)
+        yield data.get("records", [])
+        offset = data.get("offset")
+        if not offset:
+            break
+        params = {**params, "offset": offset}
+
+
+def iter_records(
+    table: str,
+    filter_formula: Optional[str] = None,
+    max_records: Optional[int] = None,
+    sort: Optional[List[Tuple[str, str]]] = None,
+    page_size: int = 100,
+    use_cache: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Yield records one by one across all pages; see iter_record_pages."""
+    for page in iter_record_pages(table, filter_formula, max_records, sort, page_size, use_cache):
+        yield from page
+
+
+def read_records(
+    table: str,
+    formula: Optional[str] = None,
+    filter_formula: Optional[str] = None,
+    use_cache: bool = False,
+    max_records: Optional[int] = None,
+    sort: Optional[List[Tuple[str, str]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Read all matching records (every page) from Airtable table with optional filterByFormula.
+    max_records and sort ([(field, "asc"|"desc"), ...]) are applied server-side.
+    With use_cache=True, identical reads within READ_CACHE_TTL_SECONDS are served from memory.
+    Prefer iter_records/iter_record_pages for single-pass scans of large tables.
+    Logs errors and re-raises on failure.
+    """
+    return list(
+        iter_records(
+            table,
+            filter_formula=filter_formula or formula,
+            max_records=max_records,
+            sort=sort,
+            use_cache=use_cache,
+        )
+    )
+
+
+def first_record(
+    table: str,
+    filter_formula: Optional[str] = None,
+    sort: Optional[List[Tuple[str, str]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Return the first matching record (maxRecords=1), or None if nothing matches.
+    """
+    records = read_records(table, filter_formula=filter_formula, max_records=1, sort=sort)
+    return records[0] if records else None
+
 
 def write_record(table: str, fields: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -68,18 +256,7 @@ def write_record(table: str, fields: Dict[str, Any]) -> Dict[str, Any]:
     Logs errors and re-raises on failure.
     """
     url = f"{API}/{BASE_ID}/{table}"
-    payload = {"fields": fields}
-    field_keys = list(fields.keys())
-
-    try:
-        r = requests.post(url, headers=HEADERS, json=payload, timeout=10)
-        if not r.ok:
-            _log_airtable_error("POST", table, None, r.status_code, r.text, field_keys)
-            r.raise_for_status()
-        return r.json()
-    except requests.exceptions.RequestException as e:
-        post_error(f"🚨 Airtable POST network error on table `{table}` with fields `{', '.join(field_keys)}`: {e}")
-        raise
+    return _send("POST", table, url, json={"fields": fields}, field_keys=list(fields.keys()))
 
 
 def update_record(table: str, record_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
@@ -88,15 +265,48 @@ def update_record(table: str, record_id: str, fields: Dict[str, Any]) -> Dict[st
     Logs errors and re-raises on failure.
     """
     url = f"{API}/{BASE_ID}/{table}/{record_id}"
-    payload = {"fields": fields}
-    field_keys = list(fields.keys())
+    return _send(
+        "PATCH", table, url, json={"fields": fields}, record_id=record_id, field_keys=list(fields.keys())
+    )
 
-    try:
-        r = requests.patch(url, headers=HEADERS, json=payload, timeout=10)
-        if not r.ok:
-            _log_airtable_error("PATCH", table, record_id, r.status_code, r.text, field_keys)
-            r.raise_for_status()
-        return r.json()
-    except requests.exceptions.RequestException as e:
-        post_error(f"🚨 Airtable PATCH network error on table `{table}`, record `{record_id}`, fields `{', '.join(field_keys)}`: {e}")
-        raise
+
+def write_records(table: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Create up to MAX_RECORDS_PER_REQUEST records in one request.
+    Logs errors and re-raises on failure.
+    """
+    url = f"{API}/{BASE_ID}/{table}"
+    payload = {"records": [{"fields": fields} for fields in records]}
+    field_keys = sorted({k for fields in records for k in fields})
+    return _send("POST", table, url, json=payload, field_keys=field_keys)
+
+
+def update_records(table: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Update up to MAX_RECORDS_PER_REQUEST records ({"id", "fields"}) in one request.
+    Logs errors and re-raises on failure.
+    """
+    url = f"{API}/{BASE_ID}/{table}"
+    payload = {"records": [{"id": rec["id"], "fields": rec["fields"]} for rec in records]}
+    field_keys = sorted({k for rec in records for k in rec["fields"]})
+    return _send("PATCH", table, url, json=payload, field_keys=field_keys)
+
+
+def upsert_records(
+    table: str,
+    records: List[Dict[str, Any]],
+    merge_fields: List[str],
+) -> Dict[str, Any]:
+    """
+    Create-or-update records in one request using Airtable's performUpsert.
+    Airtable matches on merge_fields server-side, so no lookup read is needed.
+    Logs errors and re-raises on failure.
+    """
+    url = f"{API}/{BASE_ID}/{table}"
+    payload = {
+        "performUpsert": {"fieldsToMergeOn": merge_fields},
+        "records": [{"fields": fields} for fields in records],
+        "typecast": True,
+    }
+    field_keys = sorted({k for fields in records for k in fields})
+    return _send("PATCH", table, url, json=payload, field_keys=field_keys, label="UPSERT")
@@ -0,0 +1,23 @@
+import time
+from datetime import datetime, timezone
+from typing import Tuple
+
+# (epoch second, ISO string for that second); swapped as one tuple so readers never see a torn pair
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def now_iso(with_millis: bool = False) -> str:
+    """
+    Current UTC time as a naive ISO-8601 string (same shape as datetime.utcnow().isoformat()).
+    The string is rebuilt at most once per second; with_millis appends ".mmm".
+    """
+    global _ts_cache
+    t = time.time()
+    sec = int(t)
+    cached_sec, stamp = _ts_cache
+    if sec != cached_sec:
+        stamp = datetime.fromtimestamp(sec, tz=timezone.utc).replace(tzinfo=None).isoformat()
+        _ts_cache = (sec, stamp)
+    if with_millis:
+        return f"{stamp}.{int((t - sec) * 1000):03d}"
+    return stamp
@@ -1,21 +1,16 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
 
-_engine = None
-_Session = None
+from app_v2.database import get_engine as _get_shared_engine
+from app_v2.database import get_session_maker
 
 
 def get_engine(database_url: str):
-    global _engine, _Session
-    if _engine is None:
-        _engine = create_engine(database_url, pool_pre_ping=True, future=True)
-        _Session = sessionmaker(bind=_engine, autoflush=False, autocommit=False, future=True)
-    return _engine
+    # Same cached, pooled engine the V2 modules and worker use
+    return _get_shared_engine(database_url)
 
 
 def get_session(database_url: str):
-    get_engine(database_url)
-    return _Session()
+    return get_session_maker(database_url)()
 
 
 def db_ping(database_url: str) -> dict:
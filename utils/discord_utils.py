@@ -1,13 +1,115 @@
+import atexit
+import logging
 import os
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
 import requests
+from requests.adapters import HTTPAdapter
 
 OPS = os.getenv("DISCORD_WEBHOOK_OPS", "")
 ERR = os.getenv("DISCORD_WEBHOOK_ERRORS", "")
 
+# Discord rejects message content longer than this
+DISCORD_MAX_CONTENT = 2000
+FLUSH_MAX_ITEMS = 10
+FLUSH_INTERVAL_SECONDS = 1.0
+
+logger = logging.getLogger(__name__)
+
+# Webhook posts reuse one keep-alive connection per host
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+# (webhook_url, message); drained by a single background sender so callers never block on Discord
+_QUEUE: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def _pack(messages: List[str]) -> List[str]:
+    """Join messages with newlines into as few <=2000-char posts as possible."""
+    posts: List[str] = []
+    current = ""
+    for msg in messages:
+        for i in range(0, max(len(msg), 1), DISCORD_MAX_CONTENT):
+            piece = msg[i : i + DISCORD_MAX_CONTENT]
+            if current and len(current) + 1 + len(piece) <= DISCORD_MAX_CONTENT:
+                current = f"{current}\n{piece}"
+            else:
+                if current:
+                    posts.append(current)
+                current = piece
+    if current:
+        posts.append(current)
+    return posts
+
+
+def _flush(items: List[Tuple[str, str]]) -> None:
+    by_url: Dict[str, List[str]] = {}
+    for url, msg in items:
+        by_url.setdefault(url, []).append(msg)
+    for url, messages in by_url.items():
+        for content in _pack(messages):
+            try:
+                _SESSION.post(url, json={"content": content}, timeout=5)
+            except Exception as e:
+                logger.warning("Discord webhook post failed: %s", e)
+
+
+def _drain_nowait(items: List[Tuple[str, str]]) -> None:
+    while True:
+        try:
+            items.append(_QUEUE.get_nowait())
+        except queue.Empty:
+            return
+
+
+def _sender_loop() -> None:
+    while True:
+        items = [_QUEUE.get()]
+        deadline = time.monotonic() + FLUSH_INTERVAL_SECONDS
+        while len(items) < FLUSH_MAX_ITEMS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                items.append(_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _flush(items)
+
+
+def _ensure_sender() -> None:
+    global _worker
+    if _worker is not None:
+        return
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_sender_loop, name="discord-sender", daemon=True)
+            _worker.start()
+
+
+def _enqueue(url: str, msg) -> None:
+    _ensure_sender()
+    _QUEUE.put_nowait((url, str(msg)))
+
+
+@atexit.register
+def flush_pending() -> None:
+    """Send anything still queued; runs at interpreter exit."""
+    items: List[Tuple[str, str]] = []
+    _drain_nowait(items)
+    if items:
+        _flush(items)
+
+
 def post_ops(msg):
     if OPS:
-        requests.post(OPS, json={"content": msg})
+        _enqueue(OPS, msg)
 
 def post_error(msg):
     if ERR:
-        requests.post(ERR, json={"content": msg})
+        _enqueue(ERR, msg)
@@ -1,23 +1,65 @@
 import hashlib
+import threading
+from collections import OrderedDict
 from typing import List, Dict
 from sqlalchemy import select, update
 from utils.models import SmsOutbox
 
 
+# Pre-initialized hasher; .copy() is cheaper than re-running blake2b setup per id
+_ID_HASH_BASE = hashlib.blake2b(digest_size=16)
+
+
+def _hash_id(lead_id: str, buyer_id: str, campaign_suffix: bytes) -> str:
+    h = _ID_HASH_BASE.copy()
+    h.update(f"{lead_id}|{buyer_id}".encode("utf-8"))
+    h.update(campaign_suffix)
+    return h.hexdigest()
+
+
 def _idempotency_id(lead_id: str, buyer_id: str, campaign_id: str) -> str:
-    raw = f"{lead_id}|{buyer_id}|{campaign_id}".encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()[:32]
+    return _hash_id(lead_id, buyer_id, f"|{campaign_id}".encode("utf-8"))
+
+
+# LRU of message ids already known to be in sms_outbox; lets re-runs skip the lookup
+_KNOWN_IDS_MAX = 10_000
+_known_ids: "OrderedDict[str, None]" = OrderedDict()
+_known_ids_lock = threading.Lock()
+
+
+def _is_known(msg_id: str) -> bool:
+    with _known_ids_lock:
+        if msg_id in _known_ids:
+            _known_ids.move_to_end(msg_id)
+            return True
+        return False
+
+
+def _remember(msg_ids: List[str]) -> None:
+    with _known_ids_lock:
+        for msg_id in msg_ids:
+            _known_ids[msg_id] = None
+            _known_ids.move_to_end(msg_id)
+        while len(_known_ids) > _KNOWN_IDS_MAX:
+            _known_ids.popitem(last=False)
 
 
 def enqueue_messages(session, run_id: str, campaign_id: str, items: List[Dict]) -> int:
     """
-    items: [{lead_id, buyer_id, to, body}]
+    items: [{lead_id, buyer_id, to, body, id?}]
+    Pass "id" when the caller already holds the idempotency id (e.g. computed
+    once when the item was built) to skip re-hashing here.
     """
     n = 0
+    seen: List[str] = []
+    campaign_suffix = f"|{campaign_id}".encode("utf-8")
     for it in items:
-        msg_id = _idempotency_id(it["lead_id"], it["buyer_id"], campaign_id)
+        msg_id = it.get("id") or _hash_id(it["lead_id"], it["buyer_id"], campaign_suffix)
+        if _is_known(msg_id):
+            continue
         # Upsert-like: if exists, skip
         exists = session.get(SmsOutbox, msg_id)
+        seen.append(msg_id)
         if exists:
             continue
         row = SmsOutbox(
@@ -32,6 +74,7 @@ def enqueue_messages(session, run_id: str, campaign_id: str, items: List[Dict])
         session.add(row)
         n += 1
     session.commit()
+    _remember(seen)
     return n
 
 
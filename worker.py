@@ -3,28 +3,34 @@
 from __future__ import annotations
 
 import logging
+import select as _select
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app_v2.database import get_session_maker
+from app_v2.database import get_engine, get_session_maker
 from app_v2.models.job import Job
-from engines.deal_closer_engine import run_deal_closer_engine
-from engines.govcon_engine import run_govcon_engine
-from engines.rei_engine import run_rei_engine
-from utils.airtable_utils import update_record, write_record
+from job_queue import JOB_NOTIFY_CHANNEL
+from utils.airtable_utils import (
+    update_record,
+    update_records,
+    upsert_records,
+    write_record,
+    write_records,
+)
 
 logger = logging.getLogger("worker")
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 
 SessionLocal = get_session_maker()
 
 MAX_ATTEMPTS = 5
 BASE_BACKOFF_SECONDS = 30
+# Upper bound on idle sleep; also how late a delayed (run_at) job can be picked up
+IDLE_WAIT_SECONDS = 10
 
 
 def _backoff_seconds(attempt: int) -> int:
@@ -32,17 +38,27 @@ def _backoff_seconds(attempt: int) -> int:
     return min(30 * (2 ** max(0, attempt - 1)), 480)
 
 
-def _fetch_next_job(session: Session) -> Optional[Job]:
+def _claim_next_job(session: Session) -> Optional[Job]:
+    """Pick the next due job and mark it processing in one UPDATE ... RETURNING round-trip."""
     now = datetime.now(timezone.utc)
-    stmt = (
-        select(Job)
+    next_id = (
+        select(Job.id)
         .where(Job.status.in_(["pending", "retry"]), Job.run_at <= now)
         .order_by(Job.run_at)
         .limit(1)
         .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(Job)
+        .where(Job.id == next_id)
+        .values(status="processing", attempts=Job.attempts + 1)
+        .returning(Job)
+        .execution_options(synchronize_session=False)
     )
-    result = session.execute(stmt).scalars().first()
-    return result
+    job = session.execute(stmt).scalars().first()
+    session.commit()
+    return job
 
 
 def _perform_sync_airtable(job: Job) -> None:
@@ -50,9 +66,17 @@ def _perform_sync_airtable(job: Job) -> None:
     method = payload.get("method")
     table = payload.get("table")
     fields = payload.get("fields")
+    records = payload.get("records")
     record_id = payload.get("record_id")
 
-    if not method or not table or not isinstance(fields, dict):
+    if not method or not table:
+        raise ValueError("sync_airtable missing required payload fields")
+
+    if isinstance(records, list):
+        _perform_sync_airtable_batch(method, table, records, payload.get("merge_fields"))
+        return
+
+    if not isinstance(fields, dict):
         raise ValueError("sync_airtable missing required payload fields")
 
     if method == "write":
@@ -61,6 +85,34 @@ def _perform_sync_airtable(job: Job) -> None:
         if not record_id:
             raise ValueError("record_id required for update")
         update_record(table, record_id, fields)
+    elif method == "upsert":
+        merge_fields = payload.get("merge_fields")
+        if not merge_fields:
+            raise ValueError("merge_fields required for upsert")
+        upsert_records(table, [fields], merge_fields)
+    else:
+        raise ValueError(f"Unsupported sync_airtable method: {method}")
+
+
+def _perform_sync_airtable_batch(
+    method: str,
+    table: str,
+    records: List[Dict[str, Any]],
+    merge_fields: Optional[List[str]],
+) -> None:
+    if not records:
+        return
+
+    if method == "write":
+        write_records(table, records)
+    elif method == "update":
+        if not all(rec.get("id") and isinstance(rec.get("fields"), dict) for rec in records):
+            raise ValueError("each update record requires id and fields")
+        update_records(table, records)
+    elif method == "upsert":
+        if not merge_fields:
+            raise ValueError("merge_fields required for upsert")
+        upsert_records(table, records, merge_fields)
     else:
         raise ValueError(f"Unsupported sync_airtable method: {method}")
 
@@ -68,11 +120,18 @@ def _perform_sync_airtable(job: Job) -> None:
 def _perform_run_engine(job: Job) -> None:
     payload = job.payload or {}
     engine = payload.get("engine")
+    # Engines are imported on first use; deal_closer drags in the Google API client
     if engine == "rei":
+        from engines.rei_engine import run_rei_engine
+
         run_rei_engine(payload=payload)
     elif engine == "govcon":
+        from engines.govcon_engine import run_govcon_engine
+
         run_govcon_engine(payload=payload)
     elif engine == "deal_closer":
+        from engines.deal_closer_engine import run_deal_closer_engine
+
         run_deal_closer_engine(payload=payload)
     else:
         raise ValueError(f"Unknown engine: {engine}")
@@ -92,10 +151,6 @@ HANDLERS: Dict[str, Callable[[Job], None]] = {
 
 
 def _process_job(session: Session, job: Job) -> None:
-    job.status = "processing"
-    job.attempts += 1
-    session.commit()
-
     handler = HANDLERS.get(job.type)
     if not handler:
         raise ValueError(f"No handler for job type {job.type}")
@@ -130,14 +185,61 @@ def _handle_success(session: Session, job: Job) -> None:
     session.commit()
 
 
+class _JobListener:
+    """Dedicated autocommit connection LISTENing for enqueue notifications (Postgres only)."""
+
+    def __init__(self) -> None:
+        self._raw = None
+        self._conn = None
+
+    def _connect(self) -> None:
+        engine = get_engine()
+        if engine.dialect.name != "postgresql":
+            return
+        raw = engine.raw_connection()
+        raw.detach()  # never hand an autocommit LISTEN connection back to the pool
+        conn = raw.driver_connection
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(f"LISTEN {JOB_NOTIFY_CHANNEL}")
+        self._raw, self._conn = raw, conn
+
+    def close(self) -> None:
+        if self._raw is not None:
+            try:
+                self._raw.close()
+            except Exception:  # noqa: BLE001
+                pass
+        self._raw = self._conn = None
+
+    def wait(self, timeout: float) -> None:
+        """Block until a job is enqueued or timeout elapses."""
+        try:
+            if self._conn is None:
+                self._connect()
+            if self._conn is None:
+                time.sleep(timeout)
+                return
+            readable, _, _ = _select.select([self._conn], [], [], timeout)
+            if readable:
+                self._conn.poll()
+                self._conn.notifies.clear()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Job listener error, falling back to polling: %s", exc)
+            self.close()
+            time.sleep(min(timeout, 2))
+
+
 def _worker_loop() -> None:
+    listener = _JobListener()
     while True:
-        session: Session = SessionLocal()
+        # Claimed rows stay loaded after the claim commit instead of being re-selected
+        session: Session = SessionLocal(expire_on_commit=False)
         try:
-            job = _fetch_next_job(session)
+            job = _claim_next_job(session)
             if not job:
                 session.close()
-                time.sleep(2)
+                listener.wait(IDLE_WAIT_SECONDS)
                 continue
 
             try:
@@ -154,5 +256,6 @@ def _worker_loop() -> None:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
     logger.info("Starting job worker...")
     _worker_loop()